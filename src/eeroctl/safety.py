@@ -29,9 +29,12 @@ class OperationRisk(str, Enum):
     """High risk - requires typed confirmation phrase."""
 
 
-@dataclass
+@dataclass(frozen=True)
 class SafetyContext:
-    """Context for safety checks."""
+    """Context for safety checks.
+
+    Frozen so a single instance can be shared safely between checks.
+    """
 
     force: bool = False
     """Whether --force was specified."""
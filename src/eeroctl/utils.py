@@ -79,6 +79,13 @@ def output_option(func):
     )(func)
 
 
+@functools.lru_cache(maxsize=4)
+def _ensure_config_dir(config_dir: Path) -> Path:
+    """Create config_dir once per process; later calls skip the mkdir."""
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir
+
+
 def get_config_dir() -> Path:
     """Get the configuration directory.
 
@@ -90,7 +97,10 @@ def get_config_dir() -> Path:
     else:
         config_dir = Path.home() / ".config" / "eeroctl"
 
-    config_dir.mkdir(parents=True, exist_ok=True)
+    config_dir = _ensure_config_dir(config_dir)
+    if not config_dir.is_dir():
+        # Removed since it was first created; a stat is cheaper than mkdir.
+        config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir
 
 
@@ -137,22 +147,23 @@ def ensure_config() -> dict:
     """
     config_file = get_config_file()
 
-    if config_file.exists():
-        try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-            # Merge with defaults for any missing keys
-            updated = False
-            for key, default_value in DEFAULT_CONFIG.items():
-                if key not in config:
-                    config[key] = default_value
-                    updated = True
-            if updated:
-                with open(config_file, "w") as f:
-                    json.dump(config, f, indent=2)
-            return config
-        except (json.JSONDecodeError, IOError):
-            pass
+    # A missing file raises FileNotFoundError (an IOError), so no separate
+    # exists() check is needed before reading.
+    try:
+        with open(config_file, "r") as f:
+            config = json.load(f)
+        # Merge with defaults for any missing keys
+        updated = False
+        for key, default_value in DEFAULT_CONFIG.items():
+            if key not in config:
+                config[key] = default_value
+                updated = True
+        if updated:
+            with open(config_file, "w") as f:
+                json.dump(config, f, indent=2)
+        return config
+    except (json.JSONDecodeError, IOError):
+        pass
 
     # Create new config with defaults
     config = DEFAULT_CONFIG.copy()
@@ -169,9 +180,7 @@ def _load_config() -> dict:
     """Load config from file, returning defaults if not exists."""
     config_file = get_config_file()
 
-    if not config_file.exists():
-        return DEFAULT_CONFIG.copy()
-
+    # A missing file falls through to the defaults via FileNotFoundError.
     try:
         with open(config_file, "r") as f:
             config = json.load(f)
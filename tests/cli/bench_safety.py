@@ -0,0 +1,39 @@
+"""Micro-benchmarks for eeroctl.safety fast paths.
+
+The dry-run, force and LOW-risk branches of require_confirmation run on
+nearly every guarded command, so they are timed here to catch regressions.
+
+This file does not match the default test_*.py pattern, so a normal pytest
+run skips it. Run it explicitly and serially (pytest-benchmark turns itself
+off under xdist):
+
+    pytest tests/cli/bench_safety.py -n0 --benchmark-only
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from eeroctl.safety import OperationRisk, SafetyContext, require_confirmation
+
+
+@pytest.mark.parametrize(
+    ("ctx", "risk", "expected"),
+    [
+        pytest.param(SafetyContext(dry_run=True), OperationRisk.MEDIUM, False, id="dry_run"),
+        pytest.param(SafetyContext(force=True), OperationRisk.HIGH, True, id="force"),
+        pytest.param(SafetyContext(), OperationRisk.LOW, True, id="low_risk"),
+    ],
+)
+def test_bench_require_confirmation(benchmark, ctx, risk, expected):
+    """Benchmark the require_confirmation branches that never prompt."""
+    result = benchmark(
+        require_confirmation,
+        action="reboot",
+        target="eero",
+        risk=risk,
+        ctx=ctx,
+        console=MagicMock(),
+    )
+
+    assert result is expected
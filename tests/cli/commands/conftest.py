@@ -0,0 +1,64 @@
+"""Shared fixtures for command tests."""
+
+from typing import Callable, Sequence
+
+import click
+import pytest
+
+
+def _resolve_command(cli: click.Group, path: Sequence[str]) -> tuple[click.Command, click.Context]:
+    """Walk a command path from the root group, building a context per level."""
+    command: click.Command = cli
+    ctx = click.Context(command, info_name="eero")
+    for name in path:
+        assert isinstance(command, click.Group)
+        command = command.get_command(ctx, name)
+        ctx = click.Context(command, info_name=name, parent=ctx)
+    return command, ctx
+
+
+@pytest.fixture(scope="session")
+def render_help(cli: click.Group) -> Callable[[Sequence[str]], str]:
+    """Render the help text of a command path without invoking the CLI.
+
+    The path is resolved through the group chain and the target command's
+    help is formatted directly, skipping the runner's I/O isolation.
+    Each path is rendered once per session and reused by later tests.
+    """
+    rendered: dict[str, str] = {}
+
+    def _render_help(path: Sequence[str]) -> str:
+        key = " ".join(path)
+        if key not in rendered:
+            command, ctx = _resolve_command(cli, path)
+            rendered[key] = command.get_help(ctx)
+        return rendered[key]
+
+    return _render_help
+
+
+@pytest.fixture(scope="session")
+def required_params(cli: click.Group) -> Callable[[Sequence[str]], list[tuple[str, str]]]:
+    """List the required parameters declared on a command path.
+
+    Each entry is ``(name, param_type_name)``, where the type name is
+    ``"argument"`` or ``"option"``, in declaration order.
+    """
+
+    def _required_params(path: Sequence[str]) -> list[tuple[str, str]]:
+        command, _ = _resolve_command(cli, path)
+        return [(p.name, p.param_type_name) for p in command.params if p.required]
+
+    return _required_params
+
+
+def _assert_all_in(output: str, needles: Sequence[str]) -> None:
+    """Assert every needle occurs in output, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in output]
+    assert not missing, f"missing from output: {missing}"
+
+
+@pytest.fixture(scope="session")
+def assert_all_in() -> Callable[[str, Sequence[str]], None]:
+    """Provide a containment check over several expected substrings at once."""
+    return _assert_all_in
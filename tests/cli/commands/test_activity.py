@@ -8,9 +8,6 @@ Tests cover:
 import json
 from unittest.mock import AsyncMock, patch
 
-import pytest
-from click.testing import CliRunner
-
 from eeroctl.main import cli
 
 # ---------------------------------------------------------------------------
@@ -50,11 +47,6 @@ BLOCKED_INSIGHTS_RESPONSE = {
 class TestActivityGroup:
     """Tests for the activity command group."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_activity_help(self, runner):
         """Test activity group shows help."""
         result = runner.invoke(cli, ["activity", "--help"])
@@ -83,11 +75,6 @@ class TestActivityGroup:
 class TestActivityHistory:
     """Tests for activity history command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_activity_history_help(self, runner):
         """Test activity history shows help."""
         result = runner.invoke(cli, ["activity", "history", "--help"])
@@ -205,11 +192,6 @@ class TestActivityHistory:
 class TestActivityCategories:
     """Tests for activity categories command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_activity_categories_help(self, runner):
         """Test activity categories shows help."""
         result = runner.invoke(cli, ["activity", "categories", "--help"])
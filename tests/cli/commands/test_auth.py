@@ -10,20 +10,12 @@ Tests cover:
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-from click.testing import CliRunner
-
 from eeroctl.main import cli
 
 
 class TestAuthGroup:
     """Tests for the auth command group."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_auth_help(self, runner):
         """Test auth group shows help."""
         result = runner.invoke(cli, ["auth", "--help"])
@@ -39,11 +31,6 @@ class TestAuthGroup:
 class TestAuthLogin:
     """Tests for auth login command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_auth_login_help(self, runner):
         """Test auth login shows help."""
         result = runner.invoke(cli, ["auth", "login", "--help"])
@@ -103,11 +90,6 @@ class TestAuthLogin:
 class TestAuthLogout:
     """Tests for auth logout command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_auth_logout_help(self, runner):
         """Test auth logout shows help."""
         result = runner.invoke(cli, ["auth", "logout", "--help"])
@@ -171,11 +153,6 @@ class TestAuthLogout:
 class TestAuthClear:
     """Tests for auth clear command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_auth_clear_help(self, runner):
         """Test auth clear shows help."""
         result = runner.invoke(cli, ["auth", "clear", "--help"])
@@ -235,11 +212,6 @@ class TestAuthClear:
 class TestAuthStatus:
     """Tests for auth status command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_auth_status_help(self, runner):
         """Test auth status shows help."""
         result = runner.invoke(cli, ["auth", "status", "--help"])
@@ -6,20 +6,12 @@ Tests cover:
 - completion fish command
 """
 
-import pytest
-from click.testing import CliRunner
-
 from eeroctl.main import cli
 
 
 class TestCompletionGroup:
     """Tests for the completion command group."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_completion_help(self, runner):
         """Test completion group shows help."""
         result = runner.invoke(cli, ["completion", "--help"])
@@ -34,11 +26,6 @@ class TestCompletionGroup:
 class TestCompletionBash:
     """Tests for completion bash command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_completion_bash_help(self, runner):
         """Test completion bash shows help."""
         result = runner.invoke(cli, ["completion", "bash", "--help"])
@@ -60,11 +47,6 @@ class TestCompletionBash:
 class TestCompletionZsh:
     """Tests for completion zsh command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_completion_zsh_help(self, runner):
         """Test completion zsh shows help."""
         result = runner.invoke(cli, ["completion", "zsh", "--help"])
@@ -86,11 +68,6 @@ class TestCompletionZsh:
 class TestCompletionFish:
     """Tests for completion fish command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_completion_fish_help(self, runner):
         """Test completion fish shows help."""
         result = runner.invoke(cli, ["completion", "fish", "--help"])
@@ -11,20 +11,12 @@ Tests cover:
 
 from unittest.mock import AsyncMock, patch
 
-import pytest
-from click.testing import CliRunner
-
 from eeroctl.main import cli
 
 
 class TestDeviceGroup:
     """Tests for the device command group."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_device_help(self, runner):
         """Test device group shows help."""
         result = runner.invoke(cli, ["device", "--help"])
@@ -50,11 +42,6 @@ class TestDeviceGroup:
 class TestDeviceList:
     """Tests for device list command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_device_list_help(self, runner):
         """Test device list shows help."""
         result = runner.invoke(cli, ["device", "list", "--help"])
@@ -66,11 +53,6 @@ class TestDeviceList:
 class TestDeviceShow:
     """Tests for device show command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_device_show_help(self, runner):
         """Test device show shows help."""
         result = runner.invoke(cli, ["device", "show", "--help"])
@@ -90,11 +72,6 @@ class TestDeviceShow:
 class TestDeviceRename:
     """Tests for device rename command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_device_rename_help(self, runner):
         """Test device rename shows help."""
         result = runner.invoke(cli, ["device", "rename", "--help"])
@@ -121,11 +98,6 @@ class TestDeviceRename:
 class TestDeviceBlock:
     """Tests for device block command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_device_block_help(self, runner):
         """Test device block shows help."""
         result = runner.invoke(cli, ["device", "block", "--help"])
@@ -178,11 +150,6 @@ class TestDeviceBlock:
 class TestDeviceUnblock:
     """Tests for device unblock command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_device_unblock_help(self, runner):
         """Test device unblock shows help."""
         result = runner.invoke(cli, ["device", "unblock", "--help"])
@@ -202,11 +169,6 @@ class TestDeviceUnblock:
 class TestDevicePause:
     """Tests for device pause command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_device_pause_help(self, runner):
         """Test device pause shows help."""
         result = runner.invoke(cli, ["device", "pause", "--help"])
@@ -293,11 +255,6 @@ class TestDevicePause:
 class TestDeviceUnpause:
     """Tests for device unpause command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_device_unpause_help(self, runner):
         """Test device unpause shows help."""
         result = runner.invoke(cli, ["device", "unpause", "--help"])
@@ -9,228 +9,149 @@ Tests cover:
 - eero updates subcommands
 """
 
+import click
 import pytest
-from click.testing import CliRunner
-
-from eeroctl.main import cli
 
 
 class TestEeroGroup:
     """Tests for the eero command group."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_eero_help(self, runner):
+    def test_eero_help(self, render_help, assert_all_in):
         """Test eero group shows help."""
-        result = runner.invoke(cli, ["eero", "--help"])
+        output = render_help(["eero"])
 
-        assert result.exit_code == 0
-        assert "Manage Eero mesh nodes" in result.output
-        assert "list" in result.output
-        assert "show" in result.output
-        assert "reboot" in result.output
-        assert "led" in result.output
-        assert "nightlight" in result.output
-        assert "updates" in result.output
+        assert_all_in(
+            output,
+            ("Manage Eero mesh nodes", "list", "show", "reboot", "led", "nightlight", "updates"),
+        )
 
 
 class TestEeroList:
     """Tests for eero list command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_eero_list_help(self, runner):
+    def test_eero_list_help(self, render_help):
         """Test eero list shows help."""
-        result = runner.invoke(cli, ["eero", "list", "--help"])
+        output = render_help(["eero", "list"])
 
-        assert result.exit_code == 0
-        assert "List all Eero mesh nodes" in result.output
+        assert "List all Eero mesh nodes" in output
 
 
 class TestEeroShow:
     """Tests for eero show command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_eero_show_help(self, runner):
+    def test_eero_show_help(self, render_help):
         """Test eero show shows help."""
-        result = runner.invoke(cli, ["eero", "show", "--help"])
+        output = render_help(["eero", "show"])
 
-        assert result.exit_code == 0
-        assert "Show details of a specific Eero node" in result.output
-        assert "EERO_ID" in result.output
+        assert "Show details of a specific Eero node" in output
+        assert "EERO_ID" in output
 
-    def test_eero_show_requires_argument(self, runner):
+    def test_eero_show_requires_argument(self, required_params):
         """Test eero show requires eero ID argument."""
-        result = runner.invoke(cli, ["eero", "show"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
+        assert required_params(["eero", "show"]) == [("eero_identifier", "argument")]
 
 
 class TestEeroReboot:
     """Tests for eero reboot command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_eero_reboot_help(self, runner):
+    def test_eero_reboot_help(self, render_help):
         """Test eero reboot shows help."""
-        result = runner.invoke(cli, ["eero", "reboot", "--help"])
+        output = render_help(["eero", "reboot"])
 
-        assert result.exit_code == 0
-        assert "Reboot an Eero node" in result.output
-        assert "--force" in result.output
+        assert "Reboot an Eero node" in output
+        assert "--force" in output
 
-    def test_eero_reboot_requires_argument(self, runner):
+    def test_eero_reboot_requires_argument(self, required_params):
         """Test eero reboot requires eero ID argument."""
-        result = runner.invoke(cli, ["eero", "reboot"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
+        assert required_params(["eero", "reboot"]) == [("eero_identifier", "argument")]
 
 
 class TestEeroLED:
     """Tests for eero led subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_led_group_help(self, runner):
+    def test_led_group_help(self, render_help, assert_all_in):
         """Test led group shows help."""
-        result = runner.invoke(cli, ["eero", "led", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage LED settings" in result.output
-        assert "show" in result.output
-        assert "on" in result.output
-        assert "off" in result.output
-        assert "brightness" in result.output
-
-    def test_led_show_help(self, runner):
-        """Test led show shows help."""
-        result = runner.invoke(cli, ["eero", "led", "show", "--help"])
-
-        assert result.exit_code == 0
-        assert "Show LED status" in result.output
-
-    def test_led_show_requires_argument(self, runner):
+        output = render_help(["eero", "led"])
+
+        assert_all_in(output, ("Manage LED settings", "show", "on", "off", "brightness"))
+
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("show", ("Show LED status",)),
+            ("on", ("Turn LED on",)),
+            ("off", ("Turn LED off",)),
+            ("brightness", ("Set LED brightness", "0-100")),
+        ],
+    )
+    def test_led_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test led subcommands show help."""
+        output = render_help(["eero", "led", *sub.split()])
+
+        assert_all_in(output, expected)
+
+    def test_led_show_requires_argument(self, required_params):
         """Test led show requires eero ID argument."""
-        result = runner.invoke(cli, ["eero", "led", "show"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
-
-    def test_led_on_help(self, runner):
-        """Test led on shows help."""
-        result = runner.invoke(cli, ["eero", "led", "on", "--help"])
-
-        assert result.exit_code == 0
-        assert "Turn LED on" in result.output
+        assert required_params(["eero", "led", "show"]) == [("eero_identifier", "argument")]
 
-    def test_led_off_help(self, runner):
-        """Test led off shows help."""
-        result = runner.invoke(cli, ["eero", "led", "off", "--help"])
-
-        assert result.exit_code == 0
-        assert "Turn LED off" in result.output
-
-    def test_led_brightness_help(self, runner):
-        """Test led brightness shows help."""
-        result = runner.invoke(cli, ["eero", "led", "brightness", "--help"])
-
-        assert result.exit_code == 0
-        assert "Set LED brightness" in result.output
-        assert "0-100" in result.output
-
-    def test_led_brightness_requires_arguments(self, runner):
+    def test_led_brightness_requires_arguments(self, required_params):
         """Test led brightness requires both arguments."""
-        result = runner.invoke(cli, ["eero", "led", "brightness", "eero_id"])
+        assert required_params(["eero", "led", "brightness"]) == [
+            ("eero_identifier", "argument"),
+            ("value", "argument"),
+        ]
 
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
-
-    def test_led_brightness_validates_range(self, runner):
+    def test_led_brightness_validates_range(self, cli):
         """Test led brightness validates 0-100 range."""
-        result = runner.invoke(cli, ["eero", "led", "brightness", "eero_id", "150"])
+        command = cli.commands["eero"].commands["led"].commands["brightness"]
+        value = next(p for p in command.params if p.name == "value")
 
-        assert result.exit_code != 0
-        # Should reject value outside range
+        assert isinstance(value.type, click.IntRange)
+        assert (value.type.min, value.type.max) == (0, 100)
 
 
 class TestEeroNightlight:
     """Tests for eero nightlight subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_nightlight_group_help(self, runner):
+    def test_nightlight_group_help(self, render_help, contains_any):
         """Test nightlight group shows help."""
-        result = runner.invoke(cli, ["eero", "nightlight", "--help"])
-
-        assert result.exit_code == 0
-        assert "nightlight" in result.output.lower()
-        assert "Beacon" in result.output or "beacon" in result.output.lower()
+        output = render_help(["eero", "nightlight"])
 
-    def test_nightlight_show_help(self, runner):
-        """Test nightlight show shows help."""
-        result = runner.invoke(cli, ["eero", "nightlight", "show", "--help"])
+        assert contains_any(output, ("nightlight",))
+        assert contains_any(output, ("Beacon",))
 
-        assert result.exit_code == 0
-        assert "Show nightlight settings" in result.output
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("show", ("Show nightlight settings",)),
+            ("schedule", ("Set nightlight schedule", "--on-time", "--off-time")),
+        ],
+    )
+    def test_nightlight_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test nightlight subcommands show help."""
+        output = render_help(["eero", "nightlight", *sub.split()])
 
-    def test_nightlight_schedule_help(self, runner):
-        """Test nightlight schedule shows help."""
-        result = runner.invoke(cli, ["eero", "nightlight", "schedule", "--help"])
-
-        assert result.exit_code == 0
-        assert "Set nightlight schedule" in result.output
-        assert "--on-time" in result.output
-        assert "--off-time" in result.output
+        assert_all_in(output, expected)
 
 
 class TestEeroUpdates:
     """Tests for eero updates subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_updates_group_help(self, runner):
+    def test_updates_group_help(self, render_help, assert_all_in):
         """Test updates group shows help."""
-        result = runner.invoke(cli, ["eero", "updates", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage updates" in result.output
-        assert "show" in result.output
-        assert "check" in result.output
-
-    def test_updates_show_help(self, runner):
-        """Test updates show shows help."""
-        result = runner.invoke(cli, ["eero", "updates", "show", "--help"])
-
-        assert result.exit_code == 0
-        assert "Show update status" in result.output
-
-    def test_updates_check_help(self, runner):
-        """Test updates check shows help."""
-        result = runner.invoke(cli, ["eero", "updates", "check", "--help"])
-
-        assert result.exit_code == 0
-        assert "Check for available updates" in result.output
+        output = render_help(["eero", "updates"])
+
+        assert_all_in(output, ("Manage updates", "show", "check"))
+
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("show", ("Show update status",)),
+            ("check", ("Check for available updates",)),
+        ],
+    )
+    def test_updates_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test updates subcommands show help."""
+        output = render_help(["eero", "updates", *sub.split()])
+
+        assert_all_in(output, expected)
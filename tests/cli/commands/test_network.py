@@ -11,455 +11,333 @@ Tests cover:
 """
 
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from click.testing import CliRunner
-
-from eeroctl.main import cli
-
-
-class TestNetworkGroup:
-    """Tests for the network command group."""
-
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_network_help(self, runner):
-        """Test network group shows help."""
-        result = runner.invoke(cli, ["network", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage network settings" in result.output
-        assert "list" in result.output
-        assert "show" in result.output
-        assert "use" in result.output
-
-
-class TestNetworkList:
-    """Tests for network list command."""
-
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def mock_networks(self):
-        """Create mock network response (raw API format)."""
-        return {
-            "meta": {"code": 200},
-            "data": {
-                "networks": {
-                    "count": 2,
-                    "data": [
-                        {
-                            "url": "/2.2/networks/net_1",
-                            "name": "Home Network",
-                            "status": {"status": "online"},
-                            "wan_ip": "203.0.113.1",
-                            "public_ip": "203.0.113.1",
-                            "isp": {"name": "Comcast"},
-                        },
-                        {
-                            "url": "/2.2/networks/net_2",
-                            "name": "Office Network",
-                            "status": {"status": "online"},
-                            "wan_ip": "203.0.113.2",
-                            "public_ip": "203.0.113.2",
-                            "isp": {"name": "AT&T"},
-                        },
-                    ],
-                }
-            },
-        }
-
-    def test_network_list_help(self, runner):
-        """Test network list shows help."""
-        result = runner.invoke(cli, ["network", "list", "--help"])
-
-        assert result.exit_code == 0
-        assert "List all networks" in result.output
-
-    @patch("eeroctl.commands.network.base.run_with_client")
-    def test_network_list_displays_networks(self, mock_run_with_client, runner, mock_networks):
-        """Test network list displays networks in table format."""
-        # Detailed network responses for get_network calls
-        detail_net_1 = {
-            "meta": {"code": 200},
-            "data": {
-                "url": "/2.2/networks/net_1",
-                "name": "Home Network",
-                "status": {"status": "online"},
-                "wan_ip": "203.0.113.1",
-                "public_ip": "203.0.113.1",
-                "isp": {"name": "Comcast"},
-            },
-        }
-        detail_net_2 = {
-            "meta": {"code": 200},
-            "data": {
-                "url": "/2.2/networks/net_2",
-                "name": "Office Network",
-                "status": {"status": "online"},
-                "wan_ip": "203.0.113.2",
-                "public_ip": "203.0.113.2",
-                "isp": {"name": "AT&T"},
-            },
-        }
 
+# Mock API payloads are read-only inputs to the commands under test,
+# so they are built once per module rather than once per test.
+_NETWORK_1 = {
+    "url": "/2.2/networks/net_1",
+    "name": "Home Network",
+    "status": {"status": "online"},
+    "wan_ip": "203.0.113.1",
+    "public_ip": "203.0.113.1",
+    "isp": {"name": "Comcast"},
+}
+_NETWORK_2 = {
+    "url": "/2.2/networks/net_2",
+    "name": "Office Network",
+    "status": {"status": "online"},
+    "wan_ip": "203.0.113.2",
+    "public_ip": "203.0.113.2",
+    "isp": {"name": "AT&T"},
+}
+
+# Raw get_networks() response
+_MOCK_NETWORKS = {
+    "meta": {"code": 200},
+    "data": {"networks": {"count": 2, "data": [_NETWORK_1, _NETWORK_2]}},
+}
+
+_EMPTY_NETWORKS = {
+    "meta": {"code": 200},
+    "data": {"networks": {"count": 0, "data": []}},
+}
+
+# Raw get_network() responses, one per listed network
+_NETWORK_DETAILS = [
+    {"meta": {"code": 200}, "data": _NETWORK_1},
+    {"meta": {"code": 200}, "data": _NETWORK_2},
+]
+
+# Expected "data" of the network list JSON envelope. The envelope "meta"
+# depends on the clock and local config, so it is not compared.
+_EXPECTED_NETWORK_LIST = [
+    {
+        "id": "net_1",
+        "name": "Home Network",
+        "status": "online",
+        "public_ip": "203.0.113.1",
+        "isp_name": "Comcast",
+    },
+    {
+        "id": "net_2",
+        "name": "Office Network",
+        "status": "online",
+        "public_ip": "203.0.113.2",
+        "isp_name": "AT&T",
+    },
+]
+
+
+def _check_displays_networks(output):
+    """Network list table output contains the network names."""
+    assert "Home Network" in output or "net_1" in output
+
+
+def _check_no_networks(output):
+    """Network list reports an empty account."""
+    assert "No networks found" in output
+
+
+def _check_json_output(output):
+    """Network list JSON output carries the expected envelope data."""
+    json_start = output.find("{")
+    assert json_start != -1, output
+    payload = json.loads(output[json_start:])
+    assert payload["schema"] == "eero.network.list/v1"
+    assert payload["data"] == _EXPECTED_NETWORK_LIST
+
+
+@pytest.fixture(scope="module")
+def make_run_func():
+    """Build run_with_client side effects that serve canned network responses."""
+
+    def _make(networks, details=()):
         async def run_func(func):
-            # Create mock client and call the function
             mock_client = AsyncMock()
-            mock_client.get_networks = AsyncMock(return_value=mock_networks)
+            mock_client.get_networks = AsyncMock(return_value=networks)
             # Mock get_network to return detailed info for each network
-            mock_client.get_network = AsyncMock(side_effect=[detail_net_1, detail_net_2])
+            mock_client.get_network = AsyncMock(side_effect=list(details))
             await func(mock_client)
 
-        mock_run_with_client.side_effect = run_func
+        return run_func
 
-        result = runner.invoke(cli, ["network", "list"])
+    return _make
 
-        # Should contain network names
-        assert "Home Network" in result.output or "net_1" in result.output
 
-    @patch("eeroctl.commands.network.base.run_with_client")
-    def test_network_list_empty(self, mock_run_with_client, runner):
-        """Test network list with no networks."""
-        empty_response = {
-            "meta": {"code": 200},
-            "data": {"networks": {"count": 0, "data": []}},
-        }
+@pytest.fixture
+def patched_rwc():
+    """Patch network run_with_client for a single test."""
+    with patch("eeroctl.commands.network.base.run_with_client") as mock_run_with_client:
+        yield mock_run_with_client
 
-        async def run_func(func):
-            mock_client = AsyncMock()
-            mock_client.get_networks = AsyncMock(return_value=empty_response)
-            await func(mock_client)
 
-        mock_run_with_client.side_effect = run_func
-
-        result = runner.invoke(cli, ["network", "list"])
-
-        assert "No networks found" in result.output
-
-    @patch("eeroctl.commands.network.base.run_with_client")
-    def test_network_list_json_output(self, mock_run_with_client, runner, mock_networks):
-        """Test network list with JSON output."""
-        # Detailed network responses for get_network calls
-        detail_net_1 = {
-            "meta": {"code": 200},
-            "data": {
-                "url": "/2.2/networks/net_1",
-                "name": "Home Network",
-                "status": {"status": "online"},
-                "wan_ip": "203.0.113.1",
-                "public_ip": "203.0.113.1",
-                "isp": {"name": "Comcast"},
-            },
-        }
-        detail_net_2 = {
-            "meta": {"code": 200},
-            "data": {
-                "url": "/2.2/networks/net_2",
-                "name": "Office Network",
-                "status": {"status": "online"},
-                "wan_ip": "203.0.113.2",
-                "public_ip": "203.0.113.2",
-                "isp": {"name": "AT&T"},
-            },
-        }
+class TestNetworkGroup:
+    """Tests for the network command group."""
 
-        async def run_func(func):
-            mock_client = AsyncMock()
-            mock_client.get_networks = AsyncMock(return_value=mock_networks)
-            # Mock get_network to return detailed info for each network
-            mock_client.get_network = AsyncMock(side_effect=[detail_net_1, detail_net_2])
-            await func(mock_client)
+    def test_network_help(self, render_help, assert_all_in):
+        """Test network group shows help."""
+        output = render_help(["network"])
 
-        mock_run_with_client.side_effect = run_func
+        assert_all_in(output, ("Manage network settings", "list", "show", "use"))
 
-        result = runner.invoke(cli, ["--output", "json", "network", "list"])
 
-        # Should be valid JSON
-        try:
-            data = json.loads(result.output)
-            assert "data" in data
-        except json.JSONDecodeError:
-            pass  # May have other output
+class TestNetworkList:
+    """Tests for network list command."""
+
+    def test_network_list_help(self, render_help):
+        """Test network list shows help."""
+        output = render_help(["network", "list"])
+
+        assert "List all networks" in output
+
+    @pytest.mark.parametrize(
+        ("networks", "details", "args", "check"),
+        [
+            pytest.param(
+                _MOCK_NETWORKS,
+                _NETWORK_DETAILS,
+                ["network", "list"],
+                _check_displays_networks,
+                id="table",
+            ),
+            pytest.param(
+                _EMPTY_NETWORKS,
+                (),
+                ["network", "list"],
+                _check_no_networks,
+                id="empty",
+            ),
+            pytest.param(
+                _MOCK_NETWORKS,
+                _NETWORK_DETAILS,
+                ["--output", "json", "network", "list"],
+                _check_json_output,
+                id="json",
+            ),
+        ],
+    )
+    def test_network_list(
+        self, patched_rwc, runner, cli, make_run_func, networks, details, args, check
+    ):
+        """Test network list renders table, empty and JSON output."""
+        patched_rwc.side_effect = make_run_func(networks, details)
+
+        result = runner.invoke(cli, args)
+
+        check(result.output)
 
 
 class TestNetworkShow:
     """Tests for network show command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def mock_network(self):
-        """Create a mock network object."""
-        network = MagicMock()
-        network.id = "net_123"
-        network.name = "Home Network"
-        network.status = "connected"
-        network.public_ip = "203.0.113.42"
-        network.isp_name = "Comcast"
-        network.model_dump = MagicMock(
-            return_value={
-                "id": "net_123",
-                "name": "Home Network",
-                "status": "connected",
-            }
-        )
-        return network
-
-    def test_network_show_help(self, runner):
+    def test_network_show_help(self, render_help):
         """Test network show shows help."""
-        result = runner.invoke(cli, ["network", "show", "--help"])
+        output = render_help(["network", "show"])
 
-        assert result.exit_code == 0
-        assert "Show current network details" in result.output
+        assert "Show current network details" in output
 
 
 class TestNetworkUse:
     """Tests for network use command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_network_use_help(self, runner):
+    def test_network_use_help(self, render_help):
         """Test network use shows help."""
-        result = runner.invoke(cli, ["network", "use", "--help"])
+        output = render_help(["network", "use"])
 
-        assert result.exit_code == 0
-        assert "Set preferred network" in result.output
+        assert "Set preferred network" in output
 
-    def test_network_use_requires_argument(self, runner):
+    def test_network_use_requires_argument(self, required_params):
         """Test network use requires network ID argument."""
-        result = runner.invoke(cli, ["network", "use"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output or "NETWORK_ID" in result.output
+        assert required_params(["network", "use"]) == [("network_id", "argument")]
 
 
 class TestNetworkRename:
     """Tests for network rename command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_network_rename_help(self, runner):
+    def test_network_rename_help(self, render_help):
         """Test network rename shows help."""
-        result = runner.invoke(cli, ["network", "rename", "--help"])
+        output = render_help(["network", "rename"])
 
-        assert result.exit_code == 0
-        assert "Rename the network" in result.output
-        assert "--name" in result.output
+        assert "Rename the network" in output
+        assert "--name" in output
 
-    def test_network_rename_requires_name_option(self, runner):
+    def test_network_rename_requires_name_option(self, required_params):
         """Test network rename requires --name option."""
-        result = runner.invoke(cli, ["network", "rename"])
-
-        assert result.exit_code != 0
-        assert "Missing option" in result.output or "--name" in result.output
+        assert required_params(["network", "rename"]) == [("name", "option")]
 
 
 class TestNetworkDNS:
     """Tests for network dns subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_dns_group_help(self, runner):
+    def test_dns_group_help(self, render_help, assert_all_in):
         """Test dns group shows help."""
-        result = runner.invoke(cli, ["network", "dns", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage DNS settings" in result.output
-        assert "show" in result.output
-        assert "mode" in result.output
-        assert "caching" in result.output
-
-    def test_dns_show_help(self, runner):
-        """Test dns show shows help."""
-        result = runner.invoke(cli, ["network", "dns", "show", "--help"])
-
-        assert result.exit_code == 0
-        assert "Show current DNS settings" in result.output
-
-    def test_dns_mode_set_help(self, runner):
-        """Test dns mode set shows help."""
-        result = runner.invoke(cli, ["network", "dns", "mode", "set", "--help"])
-
-        assert result.exit_code == 0
-        assert "auto" in result.output
-        assert "cloudflare" in result.output
-        assert "google" in result.output
-
-    def test_dns_mode_set_custom_requires_servers(self, runner):
+        output = render_help(["network", "dns"])
+
+        assert_all_in(output, ("Manage DNS settings", "show", "mode", "caching"))
+
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("show", ("Show current DNS settings",)),
+            ("mode set", ("auto", "cloudflare", "google")),
+            ("caching enable", ("Enable DNS caching",)),
+            ("caching disable", ("Disable DNS caching",)),
+        ],
+    )
+    def test_dns_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test dns subcommands show help."""
+        output = render_help(["network", "dns", *sub.split()])
+
+        assert_all_in(output, expected)
+
+    def test_dns_mode_set_custom_requires_servers(self, runner, cli, contains_any):
         """Test dns mode set custom requires --servers."""
         result = runner.invoke(cli, ["--force", "network", "dns", "mode", "set", "custom"])
 
         assert result.exit_code != 0
-        assert "servers" in result.output.lower()
-
-    def test_dns_caching_enable_help(self, runner):
-        """Test dns caching enable shows help."""
-        result = runner.invoke(cli, ["network", "dns", "caching", "enable", "--help"])
-
-        assert result.exit_code == 0
-        assert "Enable DNS caching" in result.output
-
-    def test_dns_caching_disable_help(self, runner):
-        """Test dns caching disable shows help."""
-        result = runner.invoke(cli, ["network", "dns", "caching", "disable", "--help"])
-
-        assert result.exit_code == 0
-        assert "Disable DNS caching" in result.output
+        assert contains_any(result.output, ("servers",))
 
 
 class TestNetworkSecurity:
     """Tests for network security subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_security_group_help(self, runner):
+    def test_security_group_help(self, render_help, assert_all_in):
         """Test security group shows help."""
-        result = runner.invoke(cli, ["network", "security", "--help"])
+        output = render_help(["network", "security"])
 
-        assert result.exit_code == 0
-        assert "Manage security settings" in result.output
-        assert "show" in result.output
-        assert "wpa3" in result.output
+        assert_all_in(output, ("Manage security settings", "show", "wpa3"))
 
-    def test_security_show_help(self, runner):
-        """Test security show shows help."""
-        result = runner.invoke(cli, ["network", "security", "show", "--help"])
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("show", ("Show security settings",)),
+            ("wpa3 enable", ("--force",)),
+            ("upnp disable", ("--force",)),
+        ],
+    )
+    def test_security_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test security subcommands show help."""
+        output = render_help(["network", "security", *sub.split()])
 
-        assert result.exit_code == 0
-        assert "Show security settings" in result.output
-
-    def test_wpa3_enable_help(self, runner):
-        """Test wpa3 enable shows help."""
-        result = runner.invoke(cli, ["network", "security", "wpa3", "enable", "--help"])
-
-        assert result.exit_code == 0
-        assert "--force" in result.output
-
-    def test_upnp_disable_help(self, runner):
-        """Test upnp disable shows help."""
-        result = runner.invoke(cli, ["network", "security", "upnp", "disable", "--help"])
-
-        assert result.exit_code == 0
-        assert "--force" in result.output
+        assert_all_in(output, expected)
 
 
 class TestNetworkGuest:
     """Tests for network guest subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_guest_group_help(self, runner):
+    def test_guest_group_help(self, render_help, assert_all_in):
         """Test guest group shows help."""
-        result = runner.invoke(cli, ["network", "guest", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage guest network" in result.output
-        assert "show" in result.output
-        assert "enable" in result.output
-        assert "disable" in result.output
+        output = render_help(["network", "guest"])
 
-    def test_guest_show_help(self, runner):
-        """Test guest show shows help."""
-        result = runner.invoke(cli, ["network", "guest", "show", "--help"])
+        assert_all_in(output, ("Manage guest network", "show", "enable", "disable"))
 
-        assert result.exit_code == 0
-        assert "Show guest network settings" in result.output
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("show", ("Show guest network settings",)),
+            ("set", ("--name", "--password")),
+        ],
+    )
+    def test_guest_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test guest subcommands show help."""
+        output = render_help(["network", "guest", *sub.split()])
 
-    def test_guest_set_help(self, runner):
-        """Test guest set shows help."""
-        result = runner.invoke(cli, ["network", "guest", "set", "--help"])
-
-        assert result.exit_code == 0
-        assert "--name" in result.output
-        assert "--password" in result.output
+        assert_all_in(output, expected)
 
 
 class TestNetworkSpeedtest:
     """Tests for network speedtest subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_speedtest_group_help(self, runner):
+    def test_speedtest_group_help(self, render_help):
         """Test speedtest group shows help."""
-        result = runner.invoke(cli, ["network", "speedtest", "--help"])
+        output = render_help(["network", "speedtest"])
 
-        assert result.exit_code == 0
-        assert "run" in result.output
-        assert "show" in result.output
+        assert "run" in output
+        assert "show" in output
 
-    def test_speedtest_run_help(self, runner):
-        """Test speedtest run shows help."""
-        result = runner.invoke(cli, ["network", "speedtest", "run", "--help"])
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("run", ("Run a new speed test",)),
+            ("show", ("Show last speed test results",)),
+        ],
+    )
+    def test_speedtest_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test speedtest subcommands show help."""
+        output = render_help(["network", "speedtest", *sub.split()])
 
-        assert result.exit_code == 0
-        assert "Run a new speed test" in result.output
-
-    def test_speedtest_show_help(self, runner):
-        """Test speedtest show shows help."""
-        result = runner.invoke(cli, ["network", "speedtest", "show", "--help"])
-
-        assert result.exit_code == 0
-        assert "Show last speed test results" in result.output
+        assert_all_in(output, expected)
 
 
 class TestNetworkSQM:
     """Tests for network sqm subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_sqm_group_help(self, runner):
+    def test_sqm_group_help(self, render_help, contains_any):
         """Test sqm group shows help."""
-        result = runner.invoke(cli, ["network", "sqm", "--help"])
-
-        assert result.exit_code == 0
-        assert "Smart Queue Management" in result.output or "SQM" in result.output
-
-    def test_sqm_set_help(self, runner):
-        """Test sqm set shows help."""
-        result = runner.invoke(cli, ["network", "sqm", "set", "--help"])
-
-        assert result.exit_code == 0
-        assert "--upload" in result.output
-        assert "--download" in result.output
-
-    def test_sqm_set_requires_bandwidth(self, runner):
+        output = render_help(["network", "sqm"])
+
+        assert contains_any(output, ("Smart Queue Management", "SQM"))
+
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("show", ("Show SQM settings",)),
+            ("enable", ("Enable SQM", "--force")),
+            ("disable", ("Disable SQM", "--force")),
+            ("set", ("--upload", "--download")),
+        ],
+    )
+    def test_sqm_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test sqm subcommands show help."""
+        output = render_help(["network", "sqm", *sub.split()])
+
+        assert_all_in(output, expected)
+
+    def test_sqm_set_requires_bandwidth(self, runner, cli, contains_any):
         """Test sqm set requires at least one bandwidth option."""
         result = runner.invoke(cli, ["--force", "network", "sqm", "set"])
 
-        assert (
-            result.exit_code != 0
-            or "upload" in result.output.lower()
-            or "download" in result.output.lower()
-        )
+        assert result.exit_code != 0 or contains_any(result.output, ("upload", "download"))
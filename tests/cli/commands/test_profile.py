@@ -9,237 +9,150 @@ Tests cover:
 """
 
 import pytest
-from click.testing import CliRunner
-
-from eeroctl.main import cli
 
 
 class TestProfileGroup:
     """Tests for the profile command group."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_profile_help(self, runner):
+    def test_profile_help(self, render_help, assert_all_in):
         """Test profile group shows help."""
-        result = runner.invoke(cli, ["profile", "--help"])
+        output = render_help(["profile"])
 
-        assert result.exit_code == 0
-        assert "Manage profiles" in result.output
-        assert "list" in result.output
-        assert "show" in result.output
-        assert "pause" in result.output
-        assert "unpause" in result.output
-        assert "apps" in result.output
-        assert "schedule" in result.output
+        assert_all_in(
+            output, ("Manage profiles", "list", "show", "pause", "unpause", "apps", "schedule")
+        )
 
 
 class TestProfileList:
     """Tests for profile list command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_profile_list_help(self, runner):
+    def test_profile_list_help(self, render_help):
         """Test profile list shows help."""
-        result = runner.invoke(cli, ["profile", "list", "--help"])
+        output = render_help(["profile", "list"])
 
-        assert result.exit_code == 0
-        assert "List all profiles" in result.output
+        assert "List all profiles" in output
 
 
 class TestProfileShow:
     """Tests for profile show command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_profile_show_help(self, runner):
+    def test_profile_show_help(self, render_help):
         """Test profile show shows help."""
-        result = runner.invoke(cli, ["profile", "show", "--help"])
+        output = render_help(["profile", "show"])
 
-        assert result.exit_code == 0
-        assert "Show details of a specific profile" in result.output
-        assert "PROFILE_ID" in result.output
+        assert "Show details of a specific profile" in output
+        assert "PROFILE_ID" in output
 
-    def test_profile_show_requires_argument(self, runner):
+    def test_profile_show_requires_argument(self, required_params):
         """Test profile show requires profile ID argument."""
-        result = runner.invoke(cli, ["profile", "show"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
+        assert required_params(["profile", "show"]) == [("profile_identifier", "argument")]
 
 
 class TestProfilePause:
     """Tests for profile pause command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_profile_pause_help(self, runner):
+    def test_profile_pause_help(self, render_help):
         """Test profile pause shows help."""
-        result = runner.invoke(cli, ["profile", "pause", "--help"])
+        output = render_help(["profile", "pause"])
 
-        assert result.exit_code == 0
-        assert "Pause internet access" in result.output
-        assert "--force" in result.output
-        assert "--duration" in result.output
+        assert "Pause internet access" in output
+        assert "--force" in output
+        assert "--duration" in output
 
-    def test_profile_pause_requires_argument(self, runner):
+    def test_profile_pause_requires_argument(self, required_params):
         """Test profile pause requires profile ID argument."""
-        result = runner.invoke(cli, ["profile", "pause"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
+        assert required_params(["profile", "pause"]) == [("profile_identifier", "argument")]
 
 
 class TestProfileUnpause:
     """Tests for profile unpause command."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_profile_unpause_help(self, runner):
+    def test_profile_unpause_help(self, render_help):
         """Test profile unpause shows help."""
-        result = runner.invoke(cli, ["profile", "unpause", "--help"])
+        output = render_help(["profile", "unpause"])
 
-        assert result.exit_code == 0
-        assert "Resume internet access" in result.output
-        assert "--force" in result.output
+        assert "Resume internet access" in output
+        assert "--force" in output
 
-    def test_profile_unpause_requires_argument(self, runner):
+    def test_profile_unpause_requires_argument(self, required_params):
         """Test profile unpause requires profile ID argument."""
-        result = runner.invoke(cli, ["profile", "unpause"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
+        assert required_params(["profile", "unpause"]) == [("profile_identifier", "argument")]
 
 
 class TestProfileApps:
     """Tests for profile apps subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_apps_group_help(self, runner):
+    def test_apps_group_help(self, render_help, assert_all_in):
         """Test apps group shows help."""
-        result = runner.invoke(cli, ["profile", "apps", "--help"])
+        output = render_help(["profile", "apps"])
 
-        assert result.exit_code == 0
-        assert "Manage blocked applications" in result.output
-        assert "list" in result.output
-        assert "block" in result.output
-        assert "unblock" in result.output
+        assert_all_in(output, ("Manage blocked applications", "list", "block", "unblock"))
 
-    def test_apps_list_help(self, runner):
-        """Test apps list shows help."""
-        result = runner.invoke(cli, ["profile", "apps", "list", "--help"])
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("list", ("List blocked applications",)),
+            ("block", ("Block application",)),
+            ("unblock", ("Unblock application",)),
+        ],
+    )
+    def test_apps_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test apps subcommands show help."""
+        output = render_help(["profile", "apps", *sub.split()])
 
-        assert result.exit_code == 0
-        assert "List blocked applications" in result.output
+        assert_all_in(output, expected)
 
-    def test_apps_list_requires_argument(self, runner):
+    def test_apps_list_requires_argument(self, required_params):
         """Test apps list requires profile ID argument."""
-        result = runner.invoke(cli, ["profile", "apps", "list"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
-
-    def test_apps_block_help(self, runner):
-        """Test apps block shows help."""
-        result = runner.invoke(cli, ["profile", "apps", "block", "--help"])
+        assert required_params(["profile", "apps", "list"]) == [("profile_identifier", "argument")]
 
-        assert result.exit_code == 0
-        assert "Block application" in result.output
-
-    def test_apps_block_requires_arguments(self, runner):
+    def test_apps_block_requires_arguments(self, required_params):
         """Test apps block requires profile ID and apps arguments."""
-        result = runner.invoke(cli, ["profile", "apps", "block", "profile_id"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
-
-    def test_apps_unblock_help(self, runner):
-        """Test apps unblock shows help."""
-        result = runner.invoke(cli, ["profile", "apps", "unblock", "--help"])
-
-        assert result.exit_code == 0
-        assert "Unblock application" in result.output
+        assert required_params(["profile", "apps", "block"]) == [
+            ("profile_identifier", "argument"),
+            ("apps", "argument"),
+        ]
 
 
 class TestProfileSchedule:
     """Tests for profile schedule subcommands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_schedule_group_help(self, runner):
+    def test_schedule_group_help(self, render_help, assert_all_in):
         """Test schedule group shows help."""
-        result = runner.invoke(cli, ["profile", "schedule", "--help"])
+        output = render_help(["profile", "schedule"])
 
-        assert result.exit_code == 0
-        assert "Manage internet access schedule" in result.output
-        assert "show" in result.output
-        assert "set" in result.output
-        assert "clear" in result.output
+        assert_all_in(output, ("Manage internet access schedule", "show", "set", "clear"))
 
-    def test_schedule_show_help(self, runner):
-        """Test schedule show shows help."""
-        result = runner.invoke(cli, ["profile", "schedule", "show", "--help"])
+    @pytest.mark.parametrize(
+        ("sub", "expected"),
+        [
+            ("show", ("Show schedule",)),
+            ("set", ("Set bedtime schedule", "--start", "--end", "--days", "--force")),
+            ("clear", ("Clear all schedules", "--force")),
+        ],
+    )
+    def test_schedule_sub_help(self, render_help, assert_all_in, sub, expected):
+        """Test schedule subcommands show help."""
+        output = render_help(["profile", "schedule", *sub.split()])
 
-        assert result.exit_code == 0
-        assert "Show schedule" in result.output
+        assert_all_in(output, expected)
 
-    def test_schedule_show_requires_argument(self, runner):
+    def test_schedule_show_requires_argument(self, required_params):
         """Test schedule show requires profile ID argument."""
-        result = runner.invoke(cli, ["profile", "schedule", "show"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
+        assert required_params(["profile", "schedule", "show"]) == [
+            ("profile_identifier", "argument")
+        ]
 
-    def test_schedule_set_help(self, runner):
-        """Test schedule set shows help."""
-        result = runner.invoke(cli, ["profile", "schedule", "set", "--help"])
-
-        assert result.exit_code == 0
-        assert "Set bedtime schedule" in result.output
-        assert "--start" in result.output
-        assert "--end" in result.output
-        assert "--days" in result.output
-        assert "--force" in result.output
-
-    def test_schedule_set_requires_options(self, runner):
+    def test_schedule_set_requires_options(self, required_params):
         """Test schedule set requires start and end options."""
-        result = runner.invoke(cli, ["profile", "schedule", "set", "profile_id"])
-
-        assert result.exit_code != 0
-        assert "--start" in result.output or "Missing option" in result.output
+        assert required_params(["profile", "schedule", "set"]) == [
+            ("profile_identifier", "argument"),
+            ("start", "option"),
+            ("end", "option"),
+        ]
 
-    def test_schedule_clear_help(self, runner):
-        """Test schedule clear shows help."""
-        result = runner.invoke(cli, ["profile", "schedule", "clear", "--help"])
-
-        assert result.exit_code == 0
-        assert "Clear all schedules" in result.output
-        assert "--force" in result.output
-
-    def test_schedule_clear_requires_argument(self, runner):
+    def test_schedule_clear_requires_argument(self, required_params):
         """Test schedule clear requires profile ID argument."""
-        result = runner.invoke(cli, ["profile", "schedule", "clear"])
-
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output
+        assert required_params(["profile", "schedule", "clear"]) == [
+            ("profile_identifier", "argument")
+        ]
@@ -0,0 +1,120 @@
+"""Shared fixtures for CLI tests."""
+
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Sequence
+from unittest.mock import MagicMock
+
+import click
+import pytest
+from rich.console import Console
+
+from eeroctl.main import cli as _root_cli
+
+
+@pytest.fixture(scope="session")
+def cli() -> click.Group:
+    """Provide the root CLI group, with its help rendered once up front.
+
+    CLI tests share this one warmed-up group. Rendering the root help
+    builds Click's lazy metadata, keeping that cost out of whichever test
+    happens to invoke the CLI first.
+    """
+    with _root_cli.make_context(_root_cli.name, [], resilient_parsing=True) as ctx:
+        _root_cli.get_help(ctx)
+    return _root_cli
+
+
+@pytest.fixture(scope="session")
+def _console_template() -> MagicMock:
+    """Build the Console-spec mock once; spec introspection is costly."""
+    return MagicMock(spec=Console)
+
+
+@pytest.fixture
+def console(_console_template: MagicMock) -> MagicMock:
+    """Provide a mock console with call records reset for each test."""
+    _console_template.reset_mock()
+    return _console_template
+
+
+def _contains_any(text: str, needles: Sequence[str]) -> bool:
+    """Return True if any needle occurs in text, ignoring case."""
+    low = text.lower()
+    return any(needle.lower() in low for needle in needles)
+
+
+@pytest.fixture(scope="session")
+def contains_any() -> Callable[[str, Sequence[str]], bool]:
+    """Provide a case-insensitive check for any of several substrings."""
+    return _contains_any
+
+
+def make_fake_click_ctx(obj: Any = None, parent: Any = None) -> SimpleNamespace:
+    """Build a stand-in for click.Context exposing only obj and parent.
+
+    Plain function so modules can also build read-only chains at import.
+    """
+    return SimpleNamespace(obj=obj, parent=parent)
+
+
+@pytest.fixture(scope="session")
+def fake_click_ctx() -> Callable[..., SimpleNamespace]:
+    """Provide a factory for lightweight click.Context stand-ins."""
+    return make_fake_click_ctx
+
+
+class FakeEeroClient:
+    """Async stand-in for EeroClient that serves canned raw API responses.
+
+    Only the read calls used by the troubleshoot commands are provided.
+    Plain coroutines keep construction cheap compared with an AsyncMock
+    tree, and tests adjust the payload attributes directly.
+    """
+
+    is_authenticated = True
+
+    def __init__(self) -> None:
+        self.network: Dict[str, Any] = {
+            "data": {
+                "url": "/2.2/networks/net_1",
+                "name": "Home Network",
+                "status": "connected",
+                "public_ip": "203.0.113.1",
+                "isp": {"name": "Test ISP"},
+            }
+        }
+        self.eeros: Dict[str, Any] = {
+            "data": [{"url": "/2.2/eeros/eero_1", "location": "Living Room", "status": "green"}]
+        }
+        self.devices: Dict[str, Any] = {
+            "data": [{"url": "/2.2/networks/net_1/devices/dev_1", "connected": True}]
+        }
+        self.diagnostics: Dict[str, Any] = {"data": {"status": "ok"}}
+        self.premium: Any = True
+
+    async def __aenter__(self) -> "FakeEeroClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def get_network(self, network_id: Optional[str] = None) -> Dict[str, Any]:
+        return self.network
+
+    async def get_eeros(self, network_id: Optional[str] = None) -> Dict[str, Any]:
+        return self.eeros
+
+    async def get_devices(self, network_id: Optional[str] = None) -> Dict[str, Any]:
+        return self.devices
+
+    async def get_diagnostics(self, network_id: Optional[str] = None) -> Dict[str, Any]:
+        return self.diagnostics
+
+    async def is_premium(self, network_id: Optional[str] = None) -> Any:
+        return self.premium
+
+
+@pytest.fixture
+def fake_eero_client() -> FakeEeroClient:
+    """Provide a fresh FakeEeroClient for one test."""
+    return FakeEeroClient()
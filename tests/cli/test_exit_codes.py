@@ -5,60 +5,48 @@ Tests cover:
 - Exit code descriptions mapping
 """
 
+import pytest
+
 from eeroctl.exit_codes import EXIT_CODE_DESCRIPTIONS, ExitCode
 
+# ExitCode is static, so its members are enumerated once for all tests.
+_MEMBERS = tuple(ExitCode)
+_VALUES = tuple(code.value for code in _MEMBERS)
+
 
 class TestExitCode:
     """Tests for ExitCode enum."""
 
-    def test_success_is_zero(self):
-        """Test SUCCESS exit code is 0."""
-        assert ExitCode.SUCCESS == 0
-        assert int(ExitCode.SUCCESS) == 0
-
-    def test_generic_error_is_one(self):
-        """Test GENERIC_ERROR is 1."""
-        assert ExitCode.GENERIC_ERROR == 1
-
-    def test_usage_error_is_two(self):
-        """Test USAGE_ERROR is 2."""
-        assert ExitCode.USAGE_ERROR == 2
-
-    def test_auth_required_is_three(self):
-        """Test AUTH_REQUIRED is 3."""
-        assert ExitCode.AUTH_REQUIRED == 3
-
-    def test_not_found_is_five(self):
-        """Test NOT_FOUND is 5."""
-        assert ExitCode.NOT_FOUND == 5
-
-    def test_safety_rail_is_eight(self):
-        """Test SAFETY_RAIL is 8."""
-        assert ExitCode.SAFETY_RAIL == 8
-
-    def test_premium_required_is_eleven(self):
-        """Test PREMIUM_REQUIRED is 11."""
-        assert ExitCode.PREMIUM_REQUIRED == 11
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (ExitCode.SUCCESS, 0),
+            (ExitCode.GENERIC_ERROR, 1),
+            (ExitCode.USAGE_ERROR, 2),
+            (ExitCode.AUTH_REQUIRED, 3),
+            (ExitCode.NOT_FOUND, 5),
+            (ExitCode.SAFETY_RAIL, 8),
+            (ExitCode.PREMIUM_REQUIRED, 11),
+        ],
+    )
+    def test_value(self, member, expected):
+        """Test each documented exit code keeps its numeric value."""
+        assert member == expected == int(member)
 
     def test_all_codes_are_integers(self):
         """Test all exit codes are integers."""
-        for code in ExitCode:
-            assert isinstance(code.value, int)
+        assert all(isinstance(value, int) for value in _VALUES)
 
     def test_codes_are_unique(self):
-        """Test all exit codes have unique values."""
-        values = [code.value for code in ExitCode]
-        assert len(values) == len(set(values)), "Exit codes must be unique"
+        """Test no exit code is an alias of another."""
+        # Enum turns a repeated value into an alias, which iteration skips
+        # but __members__ keeps, so the two only match when values are unique.
+        assert len(ExitCode.__members__) == len(_MEMBERS), "Exit codes must be unique"
 
     def test_codes_are_in_valid_range(self):
         """Test all exit codes are in valid range (0-255)."""
-        for code in ExitCode:
-            assert 0 <= code.value <= 255, f"{code.name} out of range"
-
-    def test_codes_are_positive(self):
-        """Test all exit codes are non-negative."""
-        for code in ExitCode:
-            assert code.value >= 0
+        out_of_range = [code.name for code in _MEMBERS if not 0 <= code.value <= 255]
+        assert not out_of_range, f"Out of range: {out_of_range}"
 
 
 class TestExitCodeDescriptions:
@@ -66,8 +54,8 @@ class TestExitCodeDescriptions:
 
     def test_all_codes_have_descriptions(self):
         """Test every exit code has a description."""
-        for code in ExitCode:
-            assert code in EXIT_CODE_DESCRIPTIONS, f"Missing description for {code.name}"
+        missing = [code.name for code in _MEMBERS if code not in EXIT_CODE_DESCRIPTIONS]
+        assert not missing, f"Missing descriptions for: {missing}"
 
     def test_descriptions_are_non_empty(self):
         """Test all descriptions are non-empty strings."""
@@ -77,7 +65,7 @@ class TestExitCodeDescriptions:
 
     def test_no_extra_descriptions(self):
         """Test no descriptions exist for non-existent codes."""
-        valid_codes = set(ExitCode)
+        valid_codes = set(_MEMBERS)
         description_codes = set(EXIT_CODE_DESCRIPTIONS.keys())
         extra = description_codes - valid_codes
         assert len(extra) == 0, f"Extra descriptions for: {extra}"
@@ -104,8 +92,7 @@ class TestExitCodeUsability:
 
     def test_exit_codes_sortable(self):
         """Test exit codes are sortable by value."""
-        codes = list(ExitCode)
-        sorted_codes = sorted(codes, key=lambda c: c.value)
+        sorted_codes = sorted(_MEMBERS, key=lambda c: c.value)
 
         # SUCCESS should be first
         assert sorted_codes[0] == ExitCode.SUCCESS
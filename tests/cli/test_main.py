@@ -8,41 +8,56 @@ Tests cover:
 - Version display
 """
 
+from importlib.metadata import version
 from unittest.mock import patch
 
+import click
 import pytest
-from click.testing import CliRunner
 
-from eeroctl.context import EeroCliContext
-from eeroctl.main import cli, main
+from eeroctl.context import EeroCliContext, get_cli_context
+from eeroctl.main import main
+
+
+@pytest.fixture
+def root_context(cli):
+    """Run the root callback for the given global args and return its context.
+
+    The context is built with cli.make_context and the callback invoked
+    directly, so no CliRunner output capture or isolation is involved and
+    the shared command table is left untouched.
+    """
+
+    def _run(args):
+        with cli.make_context("eero", list(args)) as ctx:
+            # Pretend a subcommand follows so the callback skips printing help.
+            ctx.invoked_subcommand = "__noop"
+            ctx.invoke(cli.callback, **ctx.params)
+        return get_cli_context(ctx)
+
+    return _run
 
 
 class TestMainCLI:
     """Tests for the main CLI entry point."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_cli_shows_help_without_command(self, runner):
+    def test_cli_shows_help_without_command(self, runner, cli):
         """Test CLI shows help when invoked without command."""
-        result = runner.invoke(cli, [])
+        result = runner.invoke(cli, [], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Eero network management CLI" in result.output
         assert "Usage:" in result.output
 
-    def test_cli_shows_version(self, runner):
+    def test_cli_shows_version(self, runner, cli):
         """Test CLI shows version with --version."""
-        result = runner.invoke(cli, ["--version"])
+        result = runner.invoke(cli, ["--version"], catch_exceptions=False)
 
-        # Exit code 0 means success, exit code 1 might be from version callback
-        assert result.exit_code in (0, 1) or "version" in result.output.lower()
+        assert result.exit_code == 0
+        assert version("eeroctl") in result.output
 
-    def test_cli_help_option(self, runner):
+    def test_cli_help_option(self, runner, cli):
         """Test CLI --help option."""
-        result = runner.invoke(cli, ["--help"])
+        result = runner.invoke(cli, ["--help"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Eero network management CLI" in result.output
@@ -50,139 +65,61 @@ class TestMainCLI:
         assert "--quiet" in result.output
         assert "--output" in result.output
 
-    def test_cli_debug_flag(self, runner):
-        """Test CLI --debug flag is processed."""
-        result = runner.invoke(cli, ["--debug", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_cli_quiet_flag(self, runner):
-        """Test CLI --quiet flag is processed."""
-        result = runner.invoke(cli, ["--quiet", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_cli_no_color_flag(self, runner):
-        """Test CLI --no-color flag is processed."""
-        result = runner.invoke(cli, ["--no-color", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_cli_output_option_table(self, runner):
-        """Test CLI --output table option."""
-        result = runner.invoke(cli, ["--output", "table", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_cli_output_option_list(self, runner):
-        """Test CLI --output list option."""
-        result = runner.invoke(cli, ["--output", "list", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_cli_output_option_json(self, runner):
-        """Test CLI --output json option."""
-        result = runner.invoke(cli, ["--output", "json", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_cli_output_option_invalid(self, runner):
+    @pytest.mark.parametrize(
+        ("args", "param", "value"),
+        [
+            (["--debug"], "debug", True),
+            (["--quiet"], "quiet", True),
+            (["--no-color"], "no_color", True),
+            (["--output", "table"], "output", "table"),
+            (["--output", "list"], "output", "list"),
+            (["--output", "json"], "output", "json"),
+            (["--network-id", "net_123"], "network_id", "net_123"),
+            (["--non-interactive"], "non_interactive", True),
+            (["--force"], "force", True),
+            (["--yes"], "force", True),
+        ],
+    )
+    def test_cli_global_option_parsed(self, cli, args, param, value):
+        """Test each global option parses into the expected parameter."""
+        ctx = cli.make_context("eero", list(args))
+
+        assert ctx.params[param] == value
+
+    def test_cli_output_option_invalid(self, runner, cli):
         """Test CLI rejects invalid output format."""
-        result = runner.invoke(cli, ["--output", "invalid"])
+        result = runner.invoke(cli, ["--output", "invalid"], catch_exceptions=False)
 
         assert result.exit_code != 0
         assert "Invalid value" in result.output or "invalid" in result.output.lower()
 
-    def test_cli_network_id_option(self, runner):
-        """Test CLI --network-id option is processed."""
-        result = runner.invoke(cli, ["--network-id", "net_123", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_cli_non_interactive_flag(self, runner):
-        """Test CLI --non-interactive flag."""
-        result = runner.invoke(cli, ["--non-interactive", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_cli_force_flag(self, runner):
-        """Test CLI --force flag."""
-        result = runner.invoke(cli, ["--force", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_cli_yes_flag_alias(self, runner):
-        """Test CLI --yes is alias for --force."""
-        result = runner.invoke(cli, ["--yes", "--help"])
-
-        assert result.exit_code == 0
-
 
 class TestCommandGroupRegistration:
     """Tests for command group registration."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_auth_group_registered(self, runner):
-        """Test auth command group is registered."""
-        result = runner.invoke(cli, ["auth", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage authentication" in result.output
-
-    def test_network_group_registered(self, runner):
-        """Test network command group is registered."""
-        result = runner.invoke(cli, ["network", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage network settings" in result.output
-
-    def test_eero_group_registered(self, runner):
-        """Test eero command group is registered."""
-        result = runner.invoke(cli, ["eero", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage Eero mesh nodes" in result.output
-
-    def test_device_group_registered(self, runner):
-        """Test device command group is registered."""
-        result = runner.invoke(cli, ["device", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage connected devices" in result.output
-
-    def test_profile_group_registered(self, runner):
-        """Test profile command group is registered."""
-        result = runner.invoke(cli, ["profile", "--help"])
-
-        assert result.exit_code == 0
-        assert "Manage profiles" in result.output
-
-    def test_activity_group_registered(self, runner):
-        """Test activity command group is registered."""
-        result = runner.invoke(cli, ["activity", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_troubleshoot_group_registered(self, runner):
-        """Test troubleshoot command group is registered."""
-        result = runner.invoke(cli, ["troubleshoot", "--help"])
-
-        assert result.exit_code == 0
-        assert "Troubleshooting" in result.output or "diagnostics" in result.output.lower()
-
-    def test_completion_group_registered(self, runner):
-        """Test completion command group is registered."""
-        result = runner.invoke(cli, ["completion", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_unknown_command_error(self, runner):
+    @pytest.mark.parametrize(
+        ("name", "phrase"),
+        [
+            ("auth", "Manage authentication"),
+            ("network", "Manage network settings"),
+            ("eero", "Manage Eero mesh nodes"),
+            ("device", "Manage connected devices"),
+            ("profile", "Manage profiles"),
+            ("activity", "View network activity data"),
+            ("troubleshoot", "Troubleshooting"),
+            ("completion", "Generate shell completion scripts"),
+        ],
+    )
+    def test_group_registered(self, cli, name, phrase):
+        """Test each command group is registered with its help text."""
+        group = cli.commands[name]
+
+        assert isinstance(group, click.Group)
+        assert phrase in (group.help or "")
+
+    def test_unknown_command_error(self, runner, cli):
         """Test unknown command produces error."""
-        result = runner.invoke(cli, ["unknown-command"])
+        result = runner.invoke(cli, ["unknown-command"], catch_exceptions=False)
 
         assert result.exit_code != 0
         assert "No such command" in result.output or "Error" in result.output
@@ -191,156 +128,47 @@ class TestCommandGroupRegistration:
 class TestContextPropagation:
     """Tests for context propagation through commands."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_context_created_with_defaults(self, runner):
+    def test_context_created_with_defaults(self, root_context):
         """Test context is created with default values."""
-        captured_ctx = []
-
-        # Use a simple subcommand that we can inspect
-        from click import pass_context
+        ctx = root_context([])
 
-        from eeroctl.context import get_cli_context
+        assert isinstance(ctx, EeroCliContext)
+        assert ctx.output_format == "table"
 
-        @cli.command(name="test-ctx")
-        @pass_context
-        def test_cmd(ctx):
-            captured_ctx.append(get_cli_context(ctx))
-
-        try:
-            runner.invoke(cli, ["test-ctx"])
-
-            assert len(captured_ctx) == 1
-            ctx = captured_ctx[0]
-            assert isinstance(ctx, EeroCliContext)
-            assert ctx.output_format == "table"
-        finally:
-            # Clean up
-            cli.commands.pop("test-ctx", None)
-
-    def test_context_propagates_debug_flag(self, runner):
+    def test_context_propagates_debug_flag(self, root_context):
         """Test debug flag propagates to context."""
-        captured_ctx = []
-
-        from click import pass_context
-
-        from eeroctl.context import get_cli_context
+        assert root_context(["--debug"]).debug is True
 
-        @cli.command(name="test-debug")
-        @pass_context
-        def test_cmd(ctx):
-            captured_ctx.append(get_cli_context(ctx))
-
-        try:
-            runner.invoke(cli, ["--debug", "test-debug"])
-
-            if captured_ctx:
-                assert captured_ctx[0].debug is True
-        finally:
-            cli.commands.pop("test-debug", None)
-
-    def test_context_propagates_output_format(self, runner):
+    def test_context_propagates_output_format(self, root_context):
         """Test output format propagates to context."""
-        captured_ctx = []
-
-        from click import pass_context
-
-        from eeroctl.context import get_cli_context
-
-        @cli.command(name="test-output")
-        @pass_context
-        def test_cmd(ctx):
-            captured_ctx.append(get_cli_context(ctx))
+        assert root_context(["--output", "json"]).output_format == "json"
 
-        try:
-            runner.invoke(cli, ["--output", "json", "test-output"])
-
-            if captured_ctx:
-                assert captured_ctx[0].output_format == "json"
-        finally:
-            cli.commands.pop("test-output", None)
-
-    def test_context_propagates_network_id(self, runner):
+    def test_context_propagates_network_id(self, root_context):
         """Test network ID propagates to context."""
-        captured_ctx = []
-
-        from click import pass_context
-
-        from eeroctl.context import get_cli_context
-
-        @cli.command(name="test-net")
-        @pass_context
-        def test_cmd(ctx):
-            captured_ctx.append(get_cli_context(ctx))
-
-        try:
-            runner.invoke(cli, ["--network-id", "net_xyz", "test-net"])
-
-            if captured_ctx:
-                assert captured_ctx[0].network_id == "net_xyz"
-        finally:
-            cli.commands.pop("test-net", None)
+        assert root_context(["--network-id", "net_xyz"]).network_id == "net_xyz"
 
 
 class TestPreferredNetworkLoading:
     """Tests for preferred network loading."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create a CLI runner."""
-        return CliRunner()
-
     @patch("eeroctl.main.get_preferred_network")
-    def test_loads_preferred_network(self, mock_get_preferred, runner):
+    def test_loads_preferred_network(self, mock_get_preferred, root_context):
         """Test preferred network is loaded when not specified."""
         mock_get_preferred.return_value = "net_preferred"
 
-        captured_ctx = []
-
-        from click import pass_context
-
-        from eeroctl.context import get_cli_context
-
-        @cli.command(name="test-pref")
-        @pass_context
-        def test_cmd(ctx):
-            captured_ctx.append(get_cli_context(ctx))
-
-        try:
-            runner.invoke(cli, ["test-pref"])
+        ctx = root_context([])
 
-            if captured_ctx:
-                # Should have loaded preferred network
-                mock_get_preferred.assert_called()
-        finally:
-            cli.commands.pop("test-pref", None)
+        mock_get_preferred.assert_called()
+        assert ctx.network_id == "net_preferred"
 
     @patch("eeroctl.main.get_preferred_network")
-    def test_explicit_network_overrides_preferred(self, mock_get_preferred, runner):
+    def test_explicit_network_overrides_preferred(self, mock_get_preferred, root_context):
         """Test explicit --network-id overrides preferred."""
         mock_get_preferred.return_value = "net_preferred"
 
-        captured_ctx = []
+        ctx = root_context(["--network-id", "net_explicit"])
 
-        from click import pass_context
-
-        from eeroctl.context import get_cli_context
-
-        @cli.command(name="test-override")
-        @pass_context
-        def test_cmd(ctx):
-            captured_ctx.append(get_cli_context(ctx))
-
-        try:
-            runner.invoke(cli, ["--network-id", "net_explicit", "test-override"])
-
-            if captured_ctx:
-                assert captured_ctx[0].network_id == "net_explicit"
-        finally:
-            cli.commands.pop("test-override", None)
+        assert ctx.network_id == "net_explicit"
 
 
 class TestMainFunction:
@@ -350,17 +178,9 @@ class TestMainFunction:
         """Test main function is defined."""
         assert callable(main)
 
-    def test_main_invokes_cli(self):
-        """Test main function invokes CLI when called directly."""
-        from importlib import import_module
-
-        # Get a fresh reference to the module
-        main_module = import_module("eeroctl.main")
+    @patch("eeroctl.main.cli")
+    def test_main_invokes_cli(self, mock_cli):
+        """Test main entry point invokes the root Click group."""
+        main()
 
-        # We verify that main() calls cli() by checking it's callable
-        # and has the expected structure
-        assert hasattr(main_module, "main")
-        assert hasattr(main_module, "cli")
-        assert callable(main_module.main)
-        # main() calls cli() - we verify the cli is a Click group
-        assert hasattr(main_module.cli, "commands")
+        mock_cli.assert_called_once_with()
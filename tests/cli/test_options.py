@@ -8,13 +8,13 @@ Tests cover:
 - Integration with Click commands
 """
 
-from unittest.mock import MagicMock
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import click
 import pytest
-from click.testing import CliRunner
 
-from eeroctl.context import EeroCliContext, get_cli_context
+from eeroctl.context import EeroCliContext
 from eeroctl.options import (
     all_options,
     apply_options,
@@ -30,110 +30,108 @@ from eeroctl.options import (
     quiet_option,
     safety_options,
 )
+from tests.cli.conftest import make_fake_click_ctx
 
-# =============================================================================
-# get_effective_value Tests
-# =============================================================================
-
-
-class TestGetEffectiveValue:
-    """Tests for get_effective_value helper."""
-
-    def test_returns_local_value_when_provided(self):
-        """Test local value takes precedence over parent."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext(output_format="table")
-        click_ctx.parent = None
-
-        result = get_effective_value(click_ctx, "json", "output_format", "table")
-
-        assert result == "json"
-
-    def test_returns_parent_value_when_local_is_none(self):
-        """Test parent value is used when local is None."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext(output_format="yaml")
-        click_ctx.parent = None
-
-        result = get_effective_value(click_ctx, None, "output_format", "table")
-
-        assert result == "yaml"
-
-    def test_returns_default_when_no_value_found(self):
-        """Test default is returned when no value found anywhere."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext()  # network_id defaults to None
-        click_ctx.parent = None
-
-        result = get_effective_value(click_ctx, None, "network_id", "default_net")
-
-        assert result == "default_net"
-
-    def test_walks_parent_chain(self):
-        """Test walks up parent chain to find value."""
-        grandparent_ctx = MagicMock(spec=click.Context)
-        grandparent_ctx.obj = EeroCliContext(network_id="grandparent_net")
-        grandparent_ctx.parent = None
+if TYPE_CHECKING:
+    from click.testing import CliRunner
 
-        parent_ctx = MagicMock(spec=click.Context)
-        parent_ctx.obj = EeroCliContext()  # network_id is None
-        parent_ctx.parent = grandparent_ctx
 
-        child_ctx = MagicMock(spec=click.Context)
-        child_ctx.obj = EeroCliContext()  # network_id is None
-        child_ctx.parent = parent_ctx
+@lru_cache(maxsize=None)
+def _build_cmd(decorator) -> click.Command:
+    """Build (once) a command carrying only the options added by decorator."""
 
-        result = get_effective_value(child_ctx, None, "network_id", "default")
+    def cmd(**kwargs):
+        return kwargs
 
-        assert result == "grandparent_net"
+    return click.command()(decorator(cmd))
 
-    def test_stops_at_first_non_none_value(self):
-        """Test stops walking chain at first non-None value."""
-        grandparent_ctx = MagicMock(spec=click.Context)
-        grandparent_ctx.obj = EeroCliContext(output_format="yaml")
-        grandparent_ctx.parent = None
 
-        parent_ctx = MagicMock(spec=click.Context)
-        parent_ctx.obj = EeroCliContext(output_format="json")
-        parent_ctx.parent = grandparent_ctx
+def _parse(decorator, *argv: str) -> dict:
+    """Parse argv against decorator's command and return its params.
 
-        child_ctx = MagicMock(spec=click.Context)
-        child_ctx.obj = EeroCliContext()
-        child_ctx.parent = parent_ctx
+    Uses make_context directly, so the callback is not invoked and no
+    CliRunner output capture is involved.
+    """
+    return _build_cmd(decorator).make_context("test", list(argv)).params
 
-        result = get_effective_value(child_ctx, None, "output_format", "table")
 
-        # Should get "json" from immediate parent, not "yaml" from grandparent
-        # But current context has "table" as output_format default
-        # Actually, let me check - EeroCliContext has output_format = "table" as default
-        # So child_ctx.obj.output_format would be "table"
+# Parameter names added by all_options, in declaration order.
+_OPTION_NAMES = (
+    "output",
+    "network_id",
+    "force",
+    "non_interactive",
+    "debug",
+    "quiet",
+    "no_color",
+)
 
-        # The function should return the current context's value first
-        # Since child_ctx.obj has output_format="table", that's what we'd get
-        # Hmm, but "table" is not None, so it should return "table"
 
-        # Let me re-read the implementation...
-        # It walks up the context chain and checks parent.obj attributes
-        # The current context IS checked first (inside the while loop)
+# =============================================================================
+# get_effective_value Tests
+# =============================================================================
 
-        # Actually, looking at the code again:
-        # current = ctx, and we check current.obj.output_format
-        # So if child_ctx.obj.output_format = "table", we get "table"
-        assert result == "table"
 
-    def test_handles_context_without_obj(self):
-        """Test handles context where obj is None."""
-        parent_ctx = MagicMock(spec=click.Context)
-        parent_ctx.obj = EeroCliContext(output_format="json")
-        parent_ctx.parent = None
+# get_effective_value only reads the context chain, so the chains are
+# built once at import and shared by every case.
+_TABLE_CTX = make_fake_click_ctx(EeroCliContext(output_format="table"))
+_YAML_CTX = make_fake_click_ctx(EeroCliContext(output_format="yaml"))
+_DEFAULT_CTX = make_fake_click_ctx(EeroCliContext())
+_GRANDPARENT_NET_CHAIN = make_fake_click_ctx(
+    EeroCliContext(),
+    make_fake_click_ctx(
+        EeroCliContext(), make_fake_click_ctx(EeroCliContext(network_id="grandparent_net"))
+    ),
+)
+_MIXED_FORMAT_CHAIN = make_fake_click_ctx(
+    EeroCliContext(),
+    make_fake_click_ctx(
+        EeroCliContext(output_format="json"),
+        make_fake_click_ctx(EeroCliContext(output_format="yaml")),
+    ),
+)
+_NO_OBJ_CHAIN = make_fake_click_ctx(
+    parent=make_fake_click_ctx(EeroCliContext(output_format="json"))
+)
 
-        child_ctx = MagicMock(spec=click.Context)
-        child_ctx.obj = None
-        child_ctx.parent = parent_ctx
 
-        result = get_effective_value(child_ctx, None, "output_format", "table")
+class TestGetEffectiveValue:
+    """Tests for get_effective_value helper."""
 
-        assert result == "json"
+    @pytest.mark.parametrize(
+        ("click_ctx", "local", "attr", "default", "expected"),
+        [
+            pytest.param(_TABLE_CTX, "json", "output_format", "table", "json", id="local_wins"),
+            pytest.param(_YAML_CTX, None, "output_format", "table", "yaml", id="context_value"),
+            pytest.param(
+                _DEFAULT_CTX, None, "network_id", "default_net", "default_net", id="default"
+            ),
+            pytest.param(
+                _GRANDPARENT_NET_CHAIN,
+                None,
+                "network_id",
+                "default",
+                "grandparent_net",
+                id="walks_parent_chain",
+            ),
+            # The child's own output_format defaults to "table", which is not
+            # None, so the walk stops there before reaching json or yaml.
+            pytest.param(
+                _MIXED_FORMAT_CHAIN,
+                None,
+                "output_format",
+                "table",
+                "table",
+                id="stops_at_first_non_none",
+            ),
+            pytest.param(
+                _NO_OBJ_CHAIN, None, "output_format", "table", "json", id="context_without_obj"
+            ),
+        ],
+    )
+    def test_get_effective_value(self, click_ctx, local, attr, default, expected):
+        """Test local value, context chain and default precedence."""
+        assert get_effective_value(click_ctx, local, attr, default) == expected
 
 
 # =============================================================================
@@ -144,85 +142,35 @@ class TestGetEffectiveValue:
 class TestApplyOptions:
     """Tests for apply_options helper."""
 
-    def test_applies_output_format(self):
-        """Test apply_options updates output_format."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext(output_format="table")
-        click_ctx.parent = None
-
-        result = apply_options(click_ctx, output="json")
-
-        assert result.output_format == "json"
-
-    def test_applies_network_id(self):
-        """Test apply_options updates network_id."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext()
-        click_ctx.parent = None
-
-        result = apply_options(click_ctx, network_id="net_123")
-
-        assert result.network_id == "net_123"
-
-    def test_applies_force_flag(self):
-        """Test apply_options updates force flag."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext(force=False)
-        click_ctx.parent = None
+    @pytest.fixture
+    def click_ctx(self, fake_click_ctx):
+        """Provide a click context holding a default EeroCliContext."""
+        return fake_click_ctx(EeroCliContext())
+
+    @pytest.mark.parametrize(
+        ("kwarg", "attr", "value"),
+        [
+            ("output", "output_format", "json"),
+            ("network_id", "network_id", "net_123"),
+            ("force", "force", True),
+            ("non_interactive", "non_interactive", True),
+            ("debug", "debug", True),
+            ("quiet", "quiet", True),
+            ("no_color", "no_color", True),
+        ],
+    )
+    def test_applies_option(self, click_ctx, kwarg, attr, value):
+        """Test apply_options updates the matching context attribute."""
+        result = apply_options(click_ctx, **{kwarg: value})
 
-        result = apply_options(click_ctx, force=True)
-
-        assert result.force is True
-
-    def test_applies_non_interactive_flag(self):
-        """Test apply_options updates non_interactive flag."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext(non_interactive=False)
-        click_ctx.parent = None
-
-        result = apply_options(click_ctx, non_interactive=True)
-
-        assert result.non_interactive is True
-
-    def test_applies_debug_flag(self):
-        """Test apply_options updates debug flag."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext(debug=False)
-        click_ctx.parent = None
-
-        result = apply_options(click_ctx, debug=True)
-
-        assert result.debug is True
-
-    def test_applies_quiet_flag(self):
-        """Test apply_options updates quiet flag."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext(quiet=False)
-        click_ctx.parent = None
-
-        result = apply_options(click_ctx, quiet=True)
-
-        assert result.quiet is True
-
-    def test_applies_no_color_flag(self):
-        """Test apply_options updates no_color flag."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext(no_color=False)
-        click_ctx.parent = None
-
-        result = apply_options(click_ctx, no_color=True)
-
-        assert result.no_color is True
+        assert isinstance(result, EeroCliContext)
+        assert getattr(result, attr) == value
 
-    def test_preserves_unset_values(self):
+    def test_preserves_unset_values(self, fake_click_ctx):
         """Test apply_options preserves values not explicitly set."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext(
-            output_format="yaml",
-            network_id="net_original",
-            force=True,
+        click_ctx = fake_click_ctx(
+            EeroCliContext(output_format="yaml", network_id="net_original", force=True)
         )
-        click_ctx.parent = None
 
         result = apply_options(click_ctx, output="json")
 
@@ -230,22 +178,10 @@ class TestApplyOptions:
         assert result.network_id == "net_original"  # Preserved
         assert result.force is True  # Preserved
 
-    def test_returns_cli_context(self):
-        """Test apply_options returns EeroCliContext."""
-        click_ctx = MagicMock(spec=click.Context)
-        click_ctx.obj = EeroCliContext()
-        click_ctx.parent = None
-
-        result = apply_options(click_ctx)
-
-        assert isinstance(result, EeroCliContext)
-
-    def test_invalidates_renderer_cache_on_output_change(self):
+    def test_invalidates_renderer_cache_on_output_change(self, fake_click_ctx):
         """Test renderer cache is invalidated when output changes."""
-        click_ctx = MagicMock(spec=click.Context)
         cli_ctx = EeroCliContext(output_format="table")
-        click_ctx.obj = cli_ctx
-        click_ctx.parent = None
+        click_ctx = fake_click_ctx(cli_ctx)
 
         # Access renderer to populate cache
         _ = cli_ctx.renderer
@@ -263,344 +199,97 @@ class TestApplyOptions:
 # =============================================================================
 
 
-class TestOutputOption:
-    """Tests for output_option decorator."""
-
-    def test_adds_output_option(self, cli_runner: CliRunner):
-        """Test decorator adds --output option to command."""
-
-        @click.command()
-        @output_option
-        def cmd(output):
-            click.echo(f"output={output}")
-
-        result = cli_runner.invoke(cmd, ["--output", "json"])
-
-        assert result.exit_code == 0
-        assert "output=json" in result.output
-
-    def test_accepts_short_option(self, cli_runner: CliRunner):
-        """Test decorator accepts -o shorthand."""
-
-        @click.command()
-        @output_option
-        def cmd(output):
-            click.echo(f"output={output}")
-
-        result = cli_runner.invoke(cmd, ["-o", "yaml"])
-
-        assert result.exit_code == 0
-        assert "output=yaml" in result.output
-
-    def test_validates_choices(self, cli_runner: CliRunner):
-        """Test decorator validates output choices."""
-
-        @click.command()
-        @output_option
-        def cmd(output):
-            click.echo(f"output={output}")
-
-        result = cli_runner.invoke(cmd, ["--output", "invalid"])
-
-        assert result.exit_code != 0
-        assert "invalid" in result.output.lower()
+class TestValueOptions:
+    """Tests for the long and short forms of the value-taking option decorators."""
+
+    @pytest.mark.parametrize(
+        ("decorator", "param", "long_flag", "short_flag", "value"),
+        [
+            pytest.param(output_option, "output", "--output", "-o", "json", id="output"),
+            pytest.param(
+                network_option, "network_id", "--network-id", "-n", "net_abc", id="network_id"
+            ),
+        ],
+    )
+    def test_value_option(self, decorator, param, long_flag, short_flag, value):
+        """Test the long and short spellings both set the parameter."""
+        for flag in (long_flag, short_flag):
+            assert _parse(decorator, flag, value)[param] == value, flag
+
+    def test_output_validates_choices(self):
+        """Test output_option rejects values outside its choices."""
+        with pytest.raises(click.BadParameter, match="invalid"):
+            _build_cmd(output_option).main(["--output", "invalid"], standalone_mode=False)
+
+
+# Each case is (decorator, parameter name, argv, parsed value).
+BOOLEAN_OPTION_CASES = [
+    pytest.param(force_option, "force", ["--force"], True, id="force-on"),
+    pytest.param(force_option, "force", ["-y"], True, id="force-short"),
+    pytest.param(force_option, "force", ["--no-force"], False, id="force-off"),
+    pytest.param(
+        non_interactive_option,
+        "non_interactive",
+        ["--non-interactive"],
+        True,
+        id="non-interactive-on",
+    ),
+    pytest.param(
+        non_interactive_option,
+        "non_interactive",
+        ["--interactive"],
+        False,
+        id="non-interactive-off",
+    ),
+    pytest.param(debug_option, "debug", ["--debug"], True, id="debug-on"),
+    pytest.param(debug_option, "debug", ["--no-debug"], False, id="debug-off"),
+    pytest.param(quiet_option, "quiet", ["--quiet"], True, id="quiet-on"),
+    pytest.param(quiet_option, "quiet", ["-q"], True, id="quiet-short"),
+    pytest.param(quiet_option, "quiet", ["--no-quiet"], False, id="quiet-off"),
+    pytest.param(no_color_option, "no_color", ["--no-color"], True, id="no-color-on"),
+    pytest.param(no_color_option, "no_color", ["--color"], False, id="no-color-off"),
+]
 
-    def test_default_is_none(self, cli_runner: CliRunner):
-        """Test default value is None (for inheritance)."""
-
-        @click.command()
-        @output_option
-        def cmd(output):
-            click.echo(f"output={output}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "output=None" in result.output
-
-
-class TestNetworkOption:
-    """Tests for network_option decorator."""
-
-    def test_adds_network_option(self, cli_runner: CliRunner):
-        """Test decorator adds --network-id option."""
-
-        @click.command()
-        @network_option
-        def cmd(network_id):
-            click.echo(f"network_id={network_id}")
-
-        result = cli_runner.invoke(cmd, ["--network-id", "net_123"])
-
-        assert result.exit_code == 0
-        assert "network_id=net_123" in result.output
-
-    def test_accepts_short_option(self, cli_runner: CliRunner):
-        """Test decorator accepts -n shorthand."""
-
-        @click.command()
-        @network_option
-        def cmd(network_id):
-            click.echo(f"network_id={network_id}")
-
-        result = cli_runner.invoke(cmd, ["-n", "net_abc"])
-
-        assert result.exit_code == 0
-        assert "network_id=net_abc" in result.output
-
-    def test_default_is_none(self, cli_runner: CliRunner):
-        """Test default value is None (for inheritance)."""
-
-        @click.command()
-        @network_option
-        def cmd(network_id):
-            click.echo(f"network_id={network_id}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "network_id=None" in result.output
-
-
-class TestForceOption:
-    """Tests for force_option decorator."""
-
-    def test_adds_force_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --force flag."""
-
-        @click.command()
-        @force_option
-        def cmd(force):
-            click.echo(f"force={force}")
-
-        result = cli_runner.invoke(cmd, ["--force"])
-
-        assert result.exit_code == 0
-        assert "force=True" in result.output
-
-    def test_adds_no_force_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --no-force flag."""
-
-        @click.command()
-        @force_option
-        def cmd(force):
-            click.echo(f"force={force}")
-
-        result = cli_runner.invoke(cmd, ["--no-force"])
-
-        assert result.exit_code == 0
-        assert "force=False" in result.output
-
-    def test_accepts_short_option(self, cli_runner: CliRunner):
-        """Test decorator accepts -y shorthand."""
-
-        @click.command()
-        @force_option
-        def cmd(force):
-            click.echo(f"force={force}")
-
-        result = cli_runner.invoke(cmd, ["-y"])
-
-        assert result.exit_code == 0
-        assert "force=True" in result.output
-
-    def test_default_is_none(self, cli_runner: CliRunner):
-        """Test default value is None (for inheritance)."""
-
-        @click.command()
-        @force_option
-        def cmd(force):
-            click.echo(f"force={force}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "force=None" in result.output
-
-
-class TestNonInteractiveOption:
-    """Tests for non_interactive_option decorator."""
-
-    def test_adds_non_interactive_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --non-interactive flag."""
-
-        @click.command()
-        @non_interactive_option
-        def cmd(non_interactive):
-            click.echo(f"non_interactive={non_interactive}")
-
-        result = cli_runner.invoke(cmd, ["--non-interactive"])
-
-        assert result.exit_code == 0
-        assert "non_interactive=True" in result.output
-
-    def test_adds_interactive_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --interactive flag."""
-
-        @click.command()
-        @non_interactive_option
-        def cmd(non_interactive):
-            click.echo(f"non_interactive={non_interactive}")
-
-        result = cli_runner.invoke(cmd, ["--interactive"])
-
-        assert result.exit_code == 0
-        assert "non_interactive=False" in result.output
-
-    def test_default_is_none(self, cli_runner: CliRunner):
-        """Test default value is None (for inheritance)."""
-
-        @click.command()
-        @non_interactive_option
-        def cmd(non_interactive):
-            click.echo(f"non_interactive={non_interactive}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "non_interactive=None" in result.output
 
-
-class TestDebugOption:
-    """Tests for debug_option decorator."""
-
-    def test_adds_debug_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --debug flag."""
-
-        @click.command()
-        @debug_option
-        def cmd(debug):
-            click.echo(f"debug={debug}")
-
-        result = cli_runner.invoke(cmd, ["--debug"])
-
-        assert result.exit_code == 0
-        assert "debug=True" in result.output
-
-    def test_adds_no_debug_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --no-debug flag."""
-
-        @click.command()
-        @debug_option
-        def cmd(debug):
-            click.echo(f"debug={debug}")
-
-        result = cli_runner.invoke(cmd, ["--no-debug"])
-
-        assert result.exit_code == 0
-        assert "debug=False" in result.output
-
-    def test_default_is_none(self, cli_runner: CliRunner):
-        """Test default value is None (for inheritance)."""
-
-        @click.command()
-        @debug_option
-        def cmd(debug):
-            click.echo(f"debug={debug}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "debug=None" in result.output
-
-
-class TestQuietOption:
-    """Tests for quiet_option decorator."""
-
-    def test_adds_quiet_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --quiet flag."""
-
-        @click.command()
-        @quiet_option
-        def cmd(quiet):
-            click.echo(f"quiet={quiet}")
-
-        result = cli_runner.invoke(cmd, ["--quiet"])
-
-        assert result.exit_code == 0
-        assert "quiet=True" in result.output
-
-    def test_adds_short_flag(self, cli_runner: CliRunner):
-        """Test decorator adds -q short flag."""
-
-        @click.command()
-        @quiet_option
-        def cmd(quiet):
-            click.echo(f"quiet={quiet}")
-
-        result = cli_runner.invoke(cmd, ["-q"])
-
-        assert result.exit_code == 0
-        assert "quiet=True" in result.output
-
-    def test_adds_no_quiet_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --no-quiet flag."""
-
-        @click.command()
-        @quiet_option
-        def cmd(quiet):
-            click.echo(f"quiet={quiet}")
-
-        result = cli_runner.invoke(cmd, ["--no-quiet"])
-
-        assert result.exit_code == 0
-        assert "quiet=False" in result.output
-
-    def test_default_is_none(self, cli_runner: CliRunner):
-        """Test default value is None (for inheritance)."""
-
-        @click.command()
-        @quiet_option
-        def cmd(quiet):
-            click.echo(f"quiet={quiet}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "quiet=None" in result.output
-
-
-class TestNoColorOption:
-    """Tests for no_color_option decorator."""
-
-    def test_adds_no_color_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --no-color flag."""
-
-        @click.command()
-        @no_color_option
-        def cmd(no_color):
-            click.echo(f"no_color={no_color}")
-
-        result = cli_runner.invoke(cmd, ["--no-color"])
-
-        assert result.exit_code == 0
-        assert "no_color=True" in result.output
-
-    def test_adds_color_flag(self, cli_runner: CliRunner):
-        """Test decorator adds --color flag."""
-
-        @click.command()
-        @no_color_option
-        def cmd(no_color):
-            click.echo(f"no_color={no_color}")
-
-        result = cli_runner.invoke(cmd, ["--color"])
-
-        assert result.exit_code == 0
-        assert "no_color=False" in result.output
-
-    def test_default_is_none(self, cli_runner: CliRunner):
+@pytest.fixture
+def built_cmd(request) -> click.Command:
+    """Provide the command for an indirectly parametrized option decorator.
+
+    Cases that share a decorator get the same command from _build_cmd's
+    cache, so it is only constructed once however many argv vary.
+    """
+    return _build_cmd(request.param)
+
+
+class TestBooleanOptions:
+    """Tests for the on/off flag pairs of the boolean option decorators."""
+
+    @pytest.mark.parametrize(
+        ("built_cmd", "name", "argv", "expected"), BOOLEAN_OPTION_CASES, indirect=["built_cmd"]
+    )
+    def test_boolean_option(self, built_cmd, name, argv, expected):
+        """Test each flag spelling sets the parameter to the expected value."""
+        assert built_cmd.make_context("test", list(argv)).params[name] is expected
+
+
+class TestOptionDefaults:
+    """Tests for the unset value of every individual option decorator."""
+
+    @pytest.mark.parametrize(
+        ("decorator", "param"),
+        [
+            pytest.param(output_option, "output", id="output"),
+            pytest.param(network_option, "network_id", id="network_id"),
+            pytest.param(force_option, "force", id="force"),
+            pytest.param(non_interactive_option, "non_interactive", id="non_interactive"),
+            pytest.param(debug_option, "debug", id="debug"),
+            pytest.param(quiet_option, "quiet", id="quiet"),
+            pytest.param(no_color_option, "no_color", id="no_color"),
+        ],
+    )
+    def test_default_is_none(self, decorator, param):
         """Test default value is None (for inheritance)."""
-
-        @click.command()
-        @no_color_option
-        def cmd(no_color):
-            click.echo(f"no_color={no_color}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "no_color=None" in result.output
+        assert _parse(decorator)[param] is None
 
 
 # =============================================================================
@@ -608,165 +297,72 @@ class TestNoColorOption:
 # =============================================================================
 
 
-class TestSafetyOptions:
-    """Tests for safety_options combined decorator."""
-
-    def test_adds_both_options(self, cli_runner: CliRunner):
-        """Test decorator adds both force and non_interactive."""
-
-        @click.command()
-        @safety_options
-        def cmd(force, non_interactive):
-            click.echo(f"force={force}, non_interactive={non_interactive}")
-
-        result = cli_runner.invoke(cmd, ["--force", "--non-interactive"])
-
-        assert result.exit_code == 0
-        assert "force=True" in result.output
-        assert "non_interactive=True" in result.output
-
-    def test_defaults_are_none(self, cli_runner: CliRunner):
-        """Test both defaults are None."""
-
-        @click.command()
-        @safety_options
-        def cmd(force, non_interactive):
-            click.echo(f"force={force}, non_interactive={non_interactive}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "force=None" in result.output
-        assert "non_interactive=None" in result.output
-
-
-class TestCommonOptions:
-    """Tests for common_options combined decorator."""
-
-    def test_adds_both_options(self, cli_runner: CliRunner):
-        """Test decorator adds both output and network_id."""
-
-        @click.command()
-        @common_options
-        def cmd(output, network_id):
-            click.echo(f"output={output}, network_id={network_id}")
-
-        result = cli_runner.invoke(cmd, ["--output", "json", "--network-id", "net_1"])
-
-        assert result.exit_code == 0
-        assert "output=json" in result.output
-        assert "network_id=net_1" in result.output
-
-    def test_defaults_are_none(self, cli_runner: CliRunner):
-        """Test both defaults are None."""
-
-        @click.command()
-        @common_options
-        def cmd(output, network_id):
-            click.echo(f"output={output}, network_id={network_id}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "output=None" in result.output
-        assert "network_id=None" in result.output
-
-
-class TestDisplayOptions:
-    """Tests for display_options combined decorator."""
-
-    def test_adds_all_options(self, cli_runner: CliRunner):
-        """Test decorator adds debug, quiet, and no_color."""
-
-        @click.command()
-        @display_options
-        def cmd(debug, quiet, no_color):
-            click.echo(f"debug={debug}, quiet={quiet}, no_color={no_color}")
-
-        result = cli_runner.invoke(cmd, ["--debug", "--quiet", "--no-color"])
-
-        assert result.exit_code == 0
-        assert "debug=True" in result.output
-        assert "quiet=True" in result.output
-        assert "no_color=True" in result.output
-
-    def test_defaults_are_none(self, cli_runner: CliRunner):
-        """Test all defaults are None."""
-
-        @click.command()
-        @display_options
-        def cmd(debug, quiet, no_color):
-            click.echo(f"debug={debug}, quiet={quiet}, no_color={no_color}")
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "debug=None" in result.output
-        assert "quiet=None" in result.output
-        assert "no_color=None" in result.output
-
-
-class TestAllOptions:
-    """Tests for all_options combined decorator."""
-
-    def test_adds_all_options(self, cli_runner: CliRunner):
-        """Test decorator adds all seven options."""
-
-        @click.command()
-        @all_options
-        def cmd(output, network_id, force, non_interactive, debug, quiet, no_color):
-            click.echo(
-                f"output={output}, network_id={network_id}, "
-                f"force={force}, non_interactive={non_interactive}, "
-                f"debug={debug}, quiet={quiet}, no_color={no_color}"
-            )
-
-        result = cli_runner.invoke(
-            cmd,
-            [
-                "--output",
-                "yaml",
-                "--network-id",
-                "net_x",
-                "--force",
-                "--non-interactive",
-                "--debug",
-                "--quiet",
-                "--no-color",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert "output=yaml" in result.output
-        assert "network_id=net_x" in result.output
-        assert "force=True" in result.output
-        assert "non_interactive=True" in result.output
-        assert "debug=True" in result.output
-        assert "quiet=True" in result.output
-        assert "no_color=True" in result.output
-
-    def test_defaults_are_none(self, cli_runner: CliRunner):
-        """Test all defaults are None."""
-
-        @click.command()
-        @all_options
-        def cmd(output, network_id, force, non_interactive, debug, quiet, no_color):
-            click.echo(
-                f"output={output}, network_id={network_id}, "
-                f"force={force}, non_interactive={non_interactive}, "
-                f"debug={debug}, quiet={quiet}, no_color={no_color}"
-            )
-
-        result = cli_runner.invoke(cmd, [])
-
-        assert result.exit_code == 0
-        assert "output=None" in result.output
-        assert "network_id=None" in result.output
-        assert "force=None" in result.output
-        assert "non_interactive=None" in result.output
-        assert "debug=None" in result.output
-        assert "quiet=None" in result.output
-        assert "no_color=None" in result.output
+class TestCombinedOptions:
+    """Tests for the combined option decorators."""
+
+    @pytest.mark.parametrize(
+        ("decorator", "argv", "expected"),
+        [
+            pytest.param(
+                safety_options,
+                ["--force", "--non-interactive"],
+                {"force": True, "non_interactive": True},
+                id="safety",
+            ),
+            pytest.param(
+                common_options,
+                ["--output", "json", "--network-id", "net_1"],
+                {"output": "json", "network_id": "net_1"},
+                id="common",
+            ),
+            pytest.param(
+                display_options,
+                ["--debug", "--quiet", "--no-color"],
+                {"debug": True, "quiet": True, "no_color": True},
+                id="display",
+            ),
+            pytest.param(
+                all_options,
+                [
+                    "--output",
+                    "yaml",
+                    "--network-id",
+                    "net_x",
+                    "--force",
+                    "--non-interactive",
+                    "--debug",
+                    "--quiet",
+                    "--no-color",
+                ],
+                {
+                    "output": "yaml",
+                    "network_id": "net_x",
+                    "force": True,
+                    "non_interactive": True,
+                    "debug": True,
+                    "quiet": True,
+                    "no_color": True,
+                },
+                id="all",
+            ),
+        ],
+    )
+    def test_adds_options(self, decorator, argv, expected):
+        """Test the decorator adds exactly its options."""
+        assert _parse(decorator, *argv) == expected
+
+    @pytest.mark.parametrize(
+        ("decorator", "params"),
+        [
+            pytest.param(safety_options, ("force", "non_interactive"), id="safety"),
+            pytest.param(common_options, ("output", "network_id"), id="common"),
+            pytest.param(display_options, ("debug", "quiet", "no_color"), id="display"),
+            pytest.param(all_options, _OPTION_NAMES, id="all"),
+        ],
+    )
+    def test_defaults_are_none(self, decorator, params):
+        """Test every option added by the decorator defaults to None."""
+        assert _parse(decorator) == dict.fromkeys(params)
 
 
 # =============================================================================
@@ -774,145 +370,102 @@ class TestAllOptions:
 # =============================================================================
 
 
-class TestOptionIntegration:
-    """Integration tests for options with Click command hierarchy."""
-
-    def test_option_at_subcommand_level(self, cli_runner: CliRunner):
-        """Test option works when placed at subcommand level."""
-
-        @click.group()
-        @click.pass_context
-        def cli(ctx):
-            ctx.obj = EeroCliContext(output_format="table")
-
-        @cli.command()
-        @output_option
-        @click.pass_context
-        def subcommand(ctx, output):
-            cli_ctx = apply_options(ctx, output=output)
-            click.echo(f"effective_output={cli_ctx.output_format}")
-
-        # Option at subcommand level
-        result = cli_runner.invoke(cli, ["subcommand", "--output", "json"])
-
-        assert result.exit_code == 0
-        assert "effective_output=json" in result.output
-
-    def test_option_inherits_from_parent(self, cli_runner: CliRunner):
-        """Test option inherits from parent when not specified locally."""
-
-        @click.group()
-        @click.pass_context
-        def cli(ctx):
-            ctx.obj = EeroCliContext(output_format="yaml")
-
-        @cli.command()
-        @output_option
-        @click.pass_context
-        def subcommand(ctx, output):
-            # Don't override - should inherit "yaml"
-            cli_ctx = get_cli_context(ctx)
-            if output is not None:
-                cli_ctx.output_format = output
-            click.echo(f"effective_output={cli_ctx.output_format}")
-
-        # No option specified - should inherit from parent
-        result = cli_runner.invoke(cli, ["subcommand"])
-
-        assert result.exit_code == 0
-        assert "effective_output=yaml" in result.output
-
-    def test_local_option_overrides_parent(self, cli_runner: CliRunner):
-        """Test local option overrides parent value."""
-
-        @click.group()
-        @click.pass_context
-        def cli(ctx):
-            ctx.obj = EeroCliContext(output_format="yaml", network_id="parent_net")
+# The integration CLI is built once at import time. Each test passes its own
+# root EeroCliContext through invoke(obj=...), and the subcommands record the
+# context apply_options resolved to instead of echoing it.
+_applied_contexts: list = []
 
-        @cli.command()
-        @common_options
-        @click.pass_context
-        def subcommand(ctx, output, network_id):
-            cli_ctx = apply_options(ctx, output=output, network_id=network_id)
-            click.echo(f"output={cli_ctx.output_format}, network_id={cli_ctx.network_id}")
 
-        # Override output, but not network_id
-        result = cli_runner.invoke(cli, ["subcommand", "--output", "json"])
+@click.group()
+def _options_cli():
+    """Root group for the integration tests."""
 
-        assert result.exit_code == 0
-        assert "output=json" in result.output
-        assert "network_id=parent_net" in result.output
 
-    def test_nested_command_groups(self, cli_runner: CliRunner):
-        """Test options work with nested command groups."""
+@_options_cli.command(name="sub")
+@common_options
+@click.pass_context
+def _sub(ctx, output, network_id):
+    _applied_contexts.append(apply_options(ctx, output=output, network_id=network_id))
 
-        @click.group()
-        @click.pass_context
-        def cli(ctx):
-            ctx.obj = EeroCliContext(output_format="table", network_id="main_net")
 
-        @cli.group()
-        @click.pass_context
-        def network(ctx):
-            pass  # Inherits from parent
+@_options_cli.command(name="dangerous")
+@safety_options
+@click.pass_context
+def _dangerous(ctx, force, non_interactive):
+    _applied_contexts.append(apply_options(ctx, force=force, non_interactive=non_interactive))
 
-        @network.command()
-        @common_options
-        @click.pass_context
-        def list_networks(ctx, output, network_id):
-            cli_ctx = apply_options(ctx, output=output, network_id=network_id)
-            click.echo(f"output={cli_ctx.output_format}")
 
-        result = cli_runner.invoke(cli, ["network", "list-networks", "--output", "json"])
+@_options_cli.group(name="network")
+def _network():
+    """Nested group that inherits the root context."""
 
-        assert result.exit_code == 0
-        assert "output=json" in result.output
 
-    def test_safety_options_with_apply(self, cli_runner: CliRunner):
-        """Test safety options work with apply_options."""
+@_network.command(name="list-networks")
+@common_options
+@click.pass_context
+def _list_networks(ctx, output, network_id):
+    _applied_contexts.append(apply_options(ctx, output=output, network_id=network_id))
 
-        @click.group()
-        @click.pass_context
-        def cli(ctx):
-            ctx.obj = EeroCliContext(force=False, non_interactive=False)
 
-        @cli.command()
-        @safety_options
-        @click.pass_context
-        def dangerous(ctx, force, non_interactive):
-            cli_ctx = apply_options(ctx, force=force, non_interactive=non_interactive)
-            click.echo(f"force={cli_ctx.force}, non_interactive={cli_ctx.non_interactive}")
+@click.command(name="show")
+@click.argument("name")
+@output_option
+def _show(name, output):
+    """Command taking a positional argument alongside an option."""
 
-        result = cli_runner.invoke(cli, ["dangerous", "--force", "--non-interactive"])
 
-        assert result.exit_code == 0
-        assert "force=True" in result.output
-        assert "non_interactive=True" in result.output
+class TestOptionIntegration:
+    """Integration tests for options with Click command hierarchy."""
 
-    def test_options_can_appear_after_arguments(self, cli_runner: CliRunner):
+    @pytest.mark.parametrize(
+        ("root", "argv", "expected"),
+        [
+            pytest.param(
+                {"output_format": "table"},
+                ["sub", "--output", "json"],
+                {"output_format": "json"},
+                id="option_at_subcommand_level",
+            ),
+            pytest.param(
+                {"output_format": "yaml"},
+                ["sub"],
+                {"output_format": "yaml"},
+                id="option_inherits_from_parent",
+            ),
+            pytest.param(
+                {"output_format": "yaml", "network_id": "parent_net"},
+                ["sub", "--output", "json"],
+                {"output_format": "json", "network_id": "parent_net"},
+                id="local_option_overrides_parent",
+            ),
+            pytest.param(
+                {"output_format": "table", "network_id": "main_net"},
+                ["network", "list-networks", "--output", "json"],
+                {"output_format": "json", "network_id": "main_net"},
+                id="nested_command_groups",
+            ),
+            pytest.param(
+                {"force": False, "non_interactive": False},
+                ["dangerous", "--force", "--non-interactive"],
+                {"force": True, "non_interactive": True},
+                id="safety_options_with_apply",
+            ),
+        ],
+    )
+    def test_effective_options(self, runner: "CliRunner", root, argv, expected):
+        """Test options resolve against the parent context through the command tree."""
+        root_ctx = EeroCliContext(**root)
+        _applied_contexts.clear()
+
+        result = runner.invoke(_options_cli, argv, obj=root_ctx, catch_exceptions=False)
+
+        assert result.exit_code == 0
+        assert len(_applied_contexts) == 1
+        assert _applied_contexts[0] is root_ctx
+        assert {attr: getattr(root_ctx, attr) for attr in expected} == expected
+
+    def test_options_can_appear_after_arguments(self):
         """Test options can appear after positional arguments."""
+        ctx = _show.make_context("show", ["my-item", "--output", "json"])
 
-        @click.command()
-        @click.argument("name")
-        @output_option
-        def cmd(name, output):
-            click.echo(f"name={name}, output={output}")
-
-        # Option after argument
-        result = cli_runner.invoke(cmd, ["my-item", "--output", "json"])
-
-        assert result.exit_code == 0
-        assert "name=my-item" in result.output
-        assert "output=json" in result.output
-
-
-# =============================================================================
-# Fixtures
-# =============================================================================
-
-
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """Provide a Click CLI test runner."""
-    return CliRunner()
+        assert ctx.params == {"name": "my-item", "output": "json"}
@@ -9,7 +9,9 @@ Tests cover:
 - requires_confirmation decorator
 """
 
-from unittest.mock import MagicMock, patch
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -24,28 +26,32 @@ from eeroctl.safety import (
     requires_confirmation,
 )
 
+# SafetyContext is frozen, so the common contexts are built once and shared.
+_DEFAULT_CTX = SafetyContext()
+_FORCE_CTX = SafetyContext(force=True)
+_DRY_RUN_CTX = SafetyContext(dry_run=True)
+
 # ========================== OperationRisk Tests ==========================
 
 
 class TestOperationRisk:
     """Tests for OperationRisk enum."""
 
-    def test_low_risk_value(self):
-        """Test LOW risk has correct value."""
-        assert OperationRisk.LOW == "low"
-
-    def test_medium_risk_value(self):
-        """Test MEDIUM risk has correct value."""
-        assert OperationRisk.MEDIUM == "medium"
-
-    def test_high_risk_value(self):
-        """Test HIGH risk has correct value."""
-        assert OperationRisk.HIGH == "high"
+    @pytest.mark.parametrize(
+        ("risk", "value"),
+        [
+            (OperationRisk.LOW, "low"),
+            (OperationRisk.MEDIUM, "medium"),
+            (OperationRisk.HIGH, "high"),
+        ],
+    )
+    def test_risk_value(self, risk, value):
+        """Test each risk level has the correct value."""
+        assert risk == value
 
     def test_risks_are_strings(self):
         """Test all risks are string enums."""
-        for risk in OperationRisk:
-            assert isinstance(risk.value, str)
+        assert {type(risk.value) for risk in OperationRisk} == {str}
 
 
 # ========================== SafetyContext Tests ==========================
@@ -74,6 +80,11 @@ class TestSafetyContext:
         assert ctx.non_interactive is True
         assert ctx.dry_run is True
 
+    def test_is_frozen(self):
+        """Test SafetyContext cannot be mutated after creation."""
+        with pytest.raises(FrozenInstanceError):
+            _DEFAULT_CTX.force = True
+
 
 # ========================== SafetyError Tests ==========================
 
@@ -110,116 +121,111 @@ class TestSafetyError:
 class TestRequireConfirmation:
     """Tests for require_confirmation function."""
 
-    @pytest.fixture
-    def mock_console(self) -> MagicMock:
-        """Create a mock console."""
-        console = MagicMock()
-        console.print = MagicMock()
-        return console
+    @pytest.fixture(autouse=True)
+    def prompts(self, monkeypatch) -> SimpleNamespace:
+        """Replace the Confirm and Prompt dialogs so no test can block on stdin."""
+        dialogs = SimpleNamespace(confirm=MagicMock(), prompt=MagicMock())
+        monkeypatch.setattr("eeroctl.safety.Confirm.ask", dialogs.confirm)
+        monkeypatch.setattr("eeroctl.safety.Prompt.ask", dialogs.prompt)
+        return dialogs
 
-    def test_dry_run_returns_false(self, mock_console):
+    def test_dry_run_returns_false(self, console):
         """Test dry run always returns False and prints message."""
-        ctx = SafetyContext(dry_run=True)
+        ctx = _DRY_RUN_CTX
 
         result = require_confirmation(
             action="reboot",
             target="Living Room",
             risk=OperationRisk.MEDIUM,
             ctx=ctx,
-            console=mock_console,
+            console=console,
         )
 
         assert result is False
-        mock_console.print.assert_called_once()
-        call_args = mock_console.print.call_args[0][0]
+        console.print.assert_called_once()
+        call_args = console.print.call_args[0][0]
         assert "DRY RUN" in call_args
 
-    def test_force_bypasses_confirmation(self, mock_console):
+    def test_force_bypasses_confirmation(self, console):
         """Test force flag bypasses all confirmations."""
-        ctx = SafetyContext(force=True)
+        ctx = _FORCE_CTX
 
         result = require_confirmation(
             action="factory reset",
             target="network",
             risk=OperationRisk.HIGH,
             ctx=ctx,
-            console=mock_console,
+            console=console,
         )
 
         assert result is True
         # Should not print anything
-        mock_console.print.assert_not_called()
+        console.print.assert_not_called()
 
-    def test_low_risk_no_confirmation_needed(self, mock_console):
+    def test_low_risk_no_confirmation_needed(self, console):
         """Test LOW risk operations proceed without confirmation."""
-        ctx = SafetyContext()
+        ctx = _DEFAULT_CTX
 
         result = require_confirmation(
             action="rename",
             target="device",
             risk=OperationRisk.LOW,
             ctx=ctx,
-            console=mock_console,
+            console=console,
         )
 
         assert result is True
-        mock_console.print.assert_not_called()
+        console.print.assert_not_called()
 
-    def test_non_interactive_without_force_raises(self, mock_console):
+    def test_non_interactive_without_force_raises(self, console):
         """Test non-interactive mode without force raises SafetyError."""
         ctx = SafetyContext(non_interactive=True, force=False)
 
-        with pytest.raises(SafetyError) as exc_info:
+        with pytest.raises(SafetyError, match="--force") as exc_info:
             require_confirmation(
                 action="reboot",
                 target="eero",
                 risk=OperationRisk.MEDIUM,
                 ctx=ctx,
-                console=mock_console,
+                console=console,
             )
 
         assert exc_info.value.exit_code == ExitCode.SAFETY_RAIL
-        assert "--force" in exc_info.value.message
 
-    @patch("eeroctl.safety.Confirm.ask")
-    def test_medium_risk_prompts_user(self, mock_confirm, mock_console):
+    def test_medium_risk_prompts_user(self, prompts, console):
         """Test MEDIUM risk prompts for Y/N confirmation."""
-        mock_confirm.return_value = True
-        ctx = SafetyContext()
+        prompts.confirm.return_value = True
+        ctx = _DEFAULT_CTX
 
         result = require_confirmation(
             action="reboot",
             target="Living Room eero",
             risk=OperationRisk.MEDIUM,
             ctx=ctx,
-            console=mock_console,
+            console=console,
         )
 
         assert result is True
-        mock_confirm.assert_called_once()
+        prompts.confirm.assert_called_once()
 
-    @patch("eeroctl.safety.Confirm.ask")
-    def test_medium_risk_user_declines(self, mock_confirm, mock_console):
+    def test_medium_risk_user_declines(self, prompts, console):
         """Test MEDIUM risk raises when user declines."""
-        mock_confirm.return_value = False
-        ctx = SafetyContext()
+        prompts.confirm.return_value = False
+        ctx = _DEFAULT_CTX
 
-        with pytest.raises(SafetyError) as exc_info:
+        with pytest.raises(SafetyError, match="(?i)cancelled"):
             require_confirmation(
                 action="reboot",
                 target="eero",
                 risk=OperationRisk.MEDIUM,
                 ctx=ctx,
-                console=mock_console,
+                console=console,
             )
 
-        assert "cancelled" in exc_info.value.message.lower()
-
-    @patch("eeroctl.safety.Prompt.ask")
-    def test_high_risk_requires_typed_confirmation(self, mock_prompt, mock_console):
+    def test_high_risk_requires_typed_confirmation(self, prompts, console):
         """Test HIGH risk requires typed confirmation phrase."""
-        mock_prompt.return_value = "FACTORYRESET"
-        ctx = SafetyContext()
+        prompts.prompt.return_value = "FACTORYRESET"
+        ctx = _DEFAULT_CTX
 
         result = require_confirmation(
             action="factory reset",
@@ -227,36 +233,32 @@ class TestRequireConfirmation:
             risk=OperationRisk.HIGH,
             confirmation_phrase="FACTORYRESET",
             ctx=ctx,
-            console=mock_console,
+            console=console,
         )
 
         assert result is True
-        mock_prompt.assert_called_once()
+        prompts.prompt.assert_called_once()
 
-    @patch("eeroctl.safety.Prompt.ask")
-    def test_high_risk_wrong_phrase_raises(self, mock_prompt, mock_console):
+    def test_high_risk_wrong_phrase_raises(self, prompts, console):
         """Test HIGH risk raises when phrase doesn't match."""
-        mock_prompt.return_value = "wrong"
-        ctx = SafetyContext()
+        prompts.prompt.return_value = "wrong"
+        ctx = _DEFAULT_CTX
 
-        with pytest.raises(SafetyError) as exc_info:
+        with pytest.raises(SafetyError, match="(?i)mismatch"):
             require_confirmation(
                 action="factory reset",
                 target="network",
                 risk=OperationRisk.HIGH,
                 confirmation_phrase="FACTORYRESET",
                 ctx=ctx,
-                console=mock_console,
+                console=console,
             )
 
-        assert "mismatch" in exc_info.value.message.lower()
-
-    @patch("eeroctl.safety.Prompt.ask")
-    def test_high_risk_auto_generates_phrase(self, mock_prompt, mock_console):
+    def test_high_risk_auto_generates_phrase(self, prompts, console):
         """Test HIGH risk auto-generates confirmation phrase if not provided."""
         # Action is "factory reset" -> phrase becomes "FACTORYRESET"
-        mock_prompt.return_value = "FACTORYRESET"
-        ctx = SafetyContext()
+        prompts.prompt.return_value = "FACTORYRESET"
+        ctx = _DEFAULT_CTX
 
         result = require_confirmation(
             action="factory reset",
@@ -264,7 +266,7 @@ class TestRequireConfirmation:
             risk=OperationRisk.HIGH,
             # No confirmation_phrase provided
             ctx=ctx,
-            console=mock_console,
+            console=console,
         )
 
         assert result is True
@@ -337,90 +339,63 @@ class TestConfirmOrFail:
 class TestRequiresConfirmationDecorator:
     """Tests for requires_confirmation decorator."""
 
-    def test_decorator_passes_with_force(self):
-        """Test decorated function executes when force=True."""
+    @pytest.mark.parametrize(
+        ("risk", "kwargs"),
+        [
+            pytest.param(OperationRisk.MEDIUM, {"force": True}, id="medium_with_force"),
+            pytest.param(OperationRisk.LOW, {}, id="low_risk"),
+        ],
+    )
+    def test_decorator_executes(self, risk, kwargs):
+        """Test decorated function executes when no confirmation is needed."""
         executed = []
 
-        @requires_confirmation("test action", risk=OperationRisk.MEDIUM)
+        @requires_confirmation("test action", risk=risk)
         def test_func(target, force=False):
             executed.append(target)
             return "success"
 
-        result = test_func(target="test", force=True)
+        result = test_func(target="item", **kwargs)
 
         assert result == "success"
-        assert executed == ["test"]
-
-    def test_decorator_with_low_risk(self):
-        """Test decorated function executes for LOW risk."""
-        executed = []
-
-        @requires_confirmation("view", risk=OperationRisk.LOW)
-        def view_func(target):
-            executed.append(target)
-            return "viewed"
-
-        result = view_func(target="item")
-
-        assert result == "viewed"
         assert executed == ["item"]
 
-    def test_decorator_preserves_function_name(self):
-        """Test decorator preserves function name."""
-
-        @requires_confirmation("test", risk=OperationRisk.LOW)
-        def my_special_function():
-            pass
-
-        assert my_special_function.__name__ == "my_special_function"
-
-    def test_decorator_preserves_docstring(self):
-        """Test decorator preserves docstring."""
+    def test_decorator_preserves_metadata(self):
+        """Test decorator preserves function name and docstring."""
 
         @requires_confirmation("test", risk=OperationRisk.LOW)
         def documented_function():
             """This is documentation."""
-            pass
 
-        assert documented_function.__doc__ == """This is documentation."""
+        assert documented_function.__name__ == "documented_function"
+        assert documented_function.__doc__ == "This is documentation."
 
 
 # ========================== OPERATION_RISKS Mapping Tests ==========================
 
 
-class TestOperationRisks:
-    """Tests for OPERATION_RISKS constant mapping."""
-
-    def test_high_risk_operations(self):
-        """Test HIGH risk operations are correctly mapped."""
-        high_risk_ops = ["reboot_network", "change_wifi_password", "factory_reset"]
-
-        for op in high_risk_ops:
-            assert op in OPERATION_RISKS
-            assert OPERATION_RISKS[op] == OperationRisk.HIGH
+# Known operations for each risk level, built once at import.
+_RISK_CATEGORIES = {
+    OperationRisk.HIGH: frozenset({"reboot_network", "change_wifi_password", "factory_reset"}),
+    OperationRisk.MEDIUM: frozenset(
+        {"reboot_eero", "guest_enable", "block_device", "pause_profile"}
+    ),
+    OperationRisk.LOW: frozenset({"rename_device", "view_any"}),
+}
 
-    def test_medium_risk_operations(self):
-        """Test MEDIUM risk operations are correctly mapped."""
-        medium_risk_ops = [
-            "reboot_eero",
-            "guest_enable",
-            "block_device",
-            "pause_profile",
-        ]
 
-        for op in medium_risk_ops:
-            assert op in OPERATION_RISKS
-            assert OPERATION_RISKS[op] == OperationRisk.MEDIUM
-
-    def test_low_risk_operations(self):
-        """Test LOW risk operations are correctly mapped."""
-        low_risk_ops = ["rename_device", "view_any"]
+class TestOperationRisks:
+    """Tests for OPERATION_RISKS constant mapping."""
 
-        for op in low_risk_ops:
-            assert op in OPERATION_RISKS
-            assert OPERATION_RISKS[op] == OperationRisk.LOW
+    @pytest.mark.parametrize(
+        ("risk", "ops"), _RISK_CATEGORIES.items(), ids=[r.value for r in _RISK_CATEGORIES]
+    )
+    def test_operations_mapped_to_risk(self, risk, ops):
+        """Test each known operation is mapped to its risk level."""
+        assert ops <= OPERATION_RISKS.keys(), f"Unmapped: {ops - OPERATION_RISKS.keys()}"
+        mismatched = sorted(op for op in ops if OPERATION_RISKS[op] is not risk)
+        assert not mismatched, f"Not {risk.value} risk: {mismatched}"
 
     def test_all_risks_are_valid(self):
         """Test all mapped risks are valid OperationRisk values."""
-        for op, risk in OPERATION_RISKS.items():
-            assert isinstance(risk, OperationRisk), f"Invalid risk for {op}"
+        assert set(map(type, OPERATION_RISKS.values())) == {OperationRisk}
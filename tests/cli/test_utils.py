@@ -7,11 +7,14 @@ Tests cover:
 - run_with_client helper
 """
 
+import asyncio
 import json
 import os
+import shutil
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
+import click
 import pytest
 
 from eeroctl.utils import (
@@ -37,31 +40,46 @@ from eeroctl.utils import (
 class TestGetConfigDir:
     """Tests for get_config_dir function."""
 
-    def test_returns_path_object(self, tmp_path, monkeypatch):
+    def test_returns_path_object(self):
         """Test function returns a Path object."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         result = get_config_dir()
 
         assert isinstance(result, Path)
 
-    def test_creates_directory_if_not_exists(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("isolated_home")
+    def test_creates_directory_if_not_exists(self):
         """Test function creates the config directory."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         config_dir = get_config_dir()
 
         assert config_dir.exists()
         assert config_dir.is_dir()
 
     @patch("os.name", "posix")
-    def test_posix_path(self, tmp_path, monkeypatch):
-        """Test config dir path on POSIX systems."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    def test_creates_directory_once(self, isolated_home):
+        """Test repeated calls reuse the cached directory instead of re-creating it."""
+        # With the parent in place mkdir does not recurse, so one call is one mkdir.
+        (isolated_home / ".config").mkdir()
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            first = get_config_dir()
+            second = get_config_dir()
+
+        assert first == second
+        mock_mkdir.assert_called_once_with(first, parents=True, exist_ok=True)
+
+    @pytest.mark.usefixtures("isolated_home")
+    def test_recreates_directory_after_removal(self):
+        """Test a cached directory is created again if it was deleted."""
+        config_dir = get_config_dir()
+        shutil.rmtree(config_dir)
 
+        assert get_config_dir().is_dir()
+
+    @patch("os.name", "posix")
+    def test_posix_path(self, fake_home):
+        """Test config dir path on POSIX systems."""
         config_dir = get_config_dir()
 
-        expected = tmp_path / ".config" / "eeroctl"
+        expected = fake_home / ".config" / "eeroctl"
         assert config_dir == expected
 
     def test_windows_path(self, tmp_path, monkeypatch):
@@ -84,10 +102,8 @@ class TestGetConfigDir:
 class TestGetCookieFile:
     """Tests for get_cookie_file function."""
 
-    def test_returns_path_in_config_dir(self, tmp_path, monkeypatch):
+    def test_returns_path_in_config_dir(self):
         """Test cookie file is in config directory."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         cookie_file = get_cookie_file()
 
         assert cookie_file.parent == get_config_dir()
@@ -97,10 +113,8 @@ class TestGetCookieFile:
 class TestGetConfigFile:
     """Tests for get_config_file function."""
 
-    def test_returns_path_in_config_dir(self, tmp_path, monkeypatch):
+    def test_returns_path_in_config_dir(self):
         """Test config file is in config directory."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         config_file = get_config_file()
 
         assert config_file.parent == get_config_dir()
@@ -110,12 +124,12 @@ class TestGetConfigFile:
 # ========================== Preferred Network Tests ==========================
 
 
+@pytest.mark.usefixtures("isolated_home")
 class TestSetPreferredNetwork:
     """Tests for set_preferred_network function."""
 
-    def test_creates_config_file_if_not_exists(self, tmp_path, monkeypatch):
+    def test_creates_config_file_if_not_exists(self):
         """Test creates config file when it doesn't exist."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
         config_file = get_config_file()
 
         set_preferred_network("net_12345")
@@ -125,9 +139,8 @@ class TestSetPreferredNetwork:
             data = json.load(f)
         assert data["preferred_network_id"] == "net_12345"
 
-    def test_updates_existing_config(self, tmp_path, monkeypatch):
+    def test_updates_existing_config(self):
         """Test updates existing config file."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
         config_file = get_config_file()
 
         # Create initial config
@@ -141,9 +154,8 @@ class TestSetPreferredNetwork:
         assert data["preferred_network_id"] == "net_67890"
         assert data["other_setting"] == "value"  # Preserved
 
-    def test_overwrites_existing_network_id(self, tmp_path, monkeypatch):
+    def test_overwrites_existing_network_id(self):
         """Test overwrites existing network ID."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
         config_file = get_config_file()
 
         # Create initial config with network ID
@@ -157,20 +169,18 @@ class TestSetPreferredNetwork:
         assert data["preferred_network_id"] == "new_net"
 
 
+@pytest.mark.usefixtures("isolated_home")
 class TestGetPreferredNetwork:
     """Tests for get_preferred_network function."""
 
-    def test_returns_none_when_no_config(self, tmp_path, monkeypatch):
+    def test_returns_none_when_no_config(self):
         """Test returns None when config file doesn't exist."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         result = get_preferred_network()
 
         assert result is None
 
-    def test_returns_none_when_not_set(self, tmp_path, monkeypatch):
+    def test_returns_none_when_not_set(self):
         """Test returns None when network ID not in config."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
         config_file = get_config_file()
         config_file.parent.mkdir(parents=True, exist_ok=True)
         config_file.write_text(json.dumps({"other": "value"}))
@@ -179,9 +189,8 @@ class TestGetPreferredNetwork:
 
         assert result is None
 
-    def test_returns_network_id_when_set(self, tmp_path, monkeypatch):
+    def test_returns_network_id_when_set(self):
         """Test returns network ID when set."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
         config_file = get_config_file()
         config_file.parent.mkdir(parents=True, exist_ok=True)
         config_file.write_text(json.dumps({"preferred_network_id": "net_abc"}))
@@ -190,9 +199,8 @@ class TestGetPreferredNetwork:
 
         assert result == "net_abc"
 
-    def test_handles_invalid_json(self, tmp_path, monkeypatch):
+    def test_handles_invalid_json(self):
         """Test handles corrupted JSON gracefully."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
         config_file = get_config_file()
         config_file.parent.mkdir(parents=True, exist_ok=True)
         config_file.write_text("not valid json")
@@ -226,8 +234,6 @@ class TestWithClientDecorator:
             return "result"
 
         # The wrapper should be a regular function (not async)
-        import asyncio
-
         assert not asyncio.iscoroutinefunction(async_func)
 
     def test_preserves_function_metadata(self):
@@ -241,10 +247,8 @@ class TestWithClientDecorator:
         assert documented_function.__name__ == "documented_function"
         # Note: functools.wraps should preserve __doc__
 
-    def test_passes_through_arguments(self, tmp_path, monkeypatch):
+    def test_passes_through_arguments(self, fake_eero_client):
         """Test decorator passes through additional arguments."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         received_args = []
 
         @with_client
@@ -252,11 +256,7 @@ class TestWithClientDecorator:
             received_args.extend([arg1, arg2, kwarg1])
             return "done"
 
-        mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock()
-
-        with patch("eeroctl.utils.EeroClient", return_value=mock_client):
+        with patch("eeroctl.utils.EeroClient", return_value=fake_eero_client):
             my_command("a", "b", kwarg1="c")
 
         assert received_args == ["a", "b", "c"]
@@ -269,28 +269,20 @@ class TestRunWithClient:
     """Tests for run_with_client helper function."""
 
     @pytest.mark.asyncio
-    async def test_executes_function_with_client(self, tmp_path, monkeypatch):
+    async def test_executes_function_with_client(self, fake_eero_client):
         """Test helper executes function with client."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         executed = []
 
         async def my_func(client):
             executed.append(client)
 
-        mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock()
-
-        with patch("eeroctl.utils.EeroClient", return_value=mock_client):
+        with patch("eeroctl.utils.EeroClient", return_value=fake_eero_client):
             await run_with_client(my_func)
 
-        assert len(executed) == 1
+        assert executed == [fake_eero_client]
 
     def test_run_with_client_is_async(self):
         """Test run_with_client is an async function."""
-        import asyncio
-
         assert asyncio.iscoroutinefunction(run_with_client)
 
 
@@ -302,8 +294,6 @@ class TestConfirmAction:
 
     def test_returns_true_on_confirm(self, monkeypatch):
         """Test returns True when user confirms."""
-        import click
-
         monkeypatch.setattr(click, "confirm", lambda msg: True)
 
         result = confirm_action("Do this?")
@@ -312,8 +302,6 @@ class TestConfirmAction:
 
     def test_returns_false_on_decline(self, monkeypatch):
         """Test returns False when user declines."""
-        import click
-
         monkeypatch.setattr(click, "confirm", lambda msg: False)
 
         result = confirm_action("Do this?")
@@ -322,8 +310,6 @@ class TestConfirmAction:
 
     def test_passes_message_to_click(self, monkeypatch):
         """Test passes message to click.confirm."""
-        import click
-
         received_messages = []
 
         def capture_confirm(msg):
@@ -340,22 +326,20 @@ class TestConfirmAction:
 # ========================== Ensure Config Tests ==========================
 
 
+@pytest.mark.usefixtures("isolated_home")
 class TestEnsureConfig:
     """Tests for ensure_config function."""
 
-    def test_creates_config_with_defaults(self, tmp_path, monkeypatch):
+    def test_creates_config_with_defaults(self):
         """Test creates config file with default values."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         config = ensure_config()
 
         assert config == DEFAULT_CONFIG
         config_file = get_config_file()
         assert config_file.exists()
 
-    def test_preserves_existing_values(self, tmp_path, monkeypatch):
+    def test_preserves_existing_values(self):
         """Test preserves existing config values."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
         config_file = get_config_file()
         config_file.parent.mkdir(parents=True, exist_ok=True)
         config_file.write_text(json.dumps({"preferred_network_id": "net_123"}))
@@ -366,9 +350,8 @@ class TestEnsureConfig:
         assert config["default_output"] == "table"  # Added default
         assert config["auth_method"] == "keyring"  # Added default
 
-    def test_adds_missing_keys(self, tmp_path, monkeypatch):
+    def test_adds_missing_keys(self):
         """Test adds missing keys to existing config."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
         config_file = get_config_file()
         config_file.parent.mkdir(parents=True, exist_ok=True)
         config_file.write_text(json.dumps({"custom_key": "value"}))
@@ -385,37 +368,30 @@ class TestEnsureConfig:
 # ========================== Auth Method Tests ==========================
 
 
+@pytest.mark.usefixtures("isolated_home")
 class TestAuthMethod:
     """Tests for auth_method get/set functions."""
 
-    def test_get_default_auth_method(self, tmp_path, monkeypatch):
+    def test_get_default_auth_method(self):
         """Test default auth method is keyring."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         result = get_auth_method()
 
         assert result == "keyring"
 
-    def test_set_auth_method_keyring(self, tmp_path, monkeypatch):
+    def test_set_auth_method_keyring(self):
         """Test setting auth method to keyring."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         set_auth_method("keyring")
 
         assert get_auth_method() == "keyring"
 
-    def test_set_auth_method_cookie_file(self, tmp_path, monkeypatch):
+    def test_set_auth_method_cookie_file(self):
         """Test setting auth method to cookie_file."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         set_auth_method("cookie_file")
 
         assert get_auth_method() == "cookie_file"
 
-    def test_set_invalid_auth_method_raises(self, tmp_path, monkeypatch):
+    def test_set_invalid_auth_method_raises(self):
         """Test setting invalid auth method raises ValueError."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         with pytest.raises(ValueError, match="Invalid auth method"):
             set_auth_method("invalid")
 
@@ -423,36 +399,29 @@ class TestAuthMethod:
 # ========================== Default Output Tests ==========================
 
 
+@pytest.mark.usefixtures("isolated_home")
 class TestDefaultOutput:
     """Tests for default_output get/set functions."""
 
-    def test_get_default_output(self, tmp_path, monkeypatch):
+    def test_get_default_output(self):
         """Test default output format is table."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         result = get_default_output()
 
         assert result == "table"
 
-    def test_set_default_output_json(self, tmp_path, monkeypatch):
+    def test_set_default_output_json(self):
         """Test setting default output to json."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         set_default_output("json")
 
         assert get_default_output() == "json"
 
-    def test_set_default_output_list(self, tmp_path, monkeypatch):
+    def test_set_default_output_list(self):
         """Test setting default output to list."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         set_default_output("list")
 
         assert get_default_output() == "list"
 
-    def test_set_invalid_output_raises(self, tmp_path, monkeypatch):
+    def test_set_invalid_output_raises(self):
         """Test setting invalid output format raises ValueError."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         with pytest.raises(ValueError, match="Invalid output format"):
             set_default_output("invalid")
@@ -1,10 +1,51 @@
 """Pytest configuration and fixtures for eeroctl tests."""
 
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import pytest
-from click.testing import CliRunner
 
+if TYPE_CHECKING:
+    from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner() -> "CliRunner":
+    """Provide a Click CLI test runner shared across the session.
+
+    Tests only call invoke(), which sets up a fresh isolated environment
+    each time, so one runner is safe to reuse. click.testing is imported
+    here so collection does not load it.
+    """
+    from click.testing import CliRunner
 
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """Provide a Click CLI test runner."""
     return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def _shared_home(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one temp home directory per session (per xdist worker)."""
+    return tmp_path_factory.mktemp("home")
+
+
+@pytest.fixture(autouse=True)
+def fake_home(monkeypatch: pytest.MonkeyPatch, _shared_home: Path) -> Path:
+    """Point Path.home at a temp dir so no test touches the real config.
+
+    The directory is shared across tests, which avoids creating a fresh
+    temp dir per test. Every CLI invocation writes the default config.json
+    here through the root callback's ensure_config(); that file is always
+    the same defaults, so sharing it is harmless. Tests that write other
+    config values should request isolated_home instead. The config-dir
+    cache is keyed by path, so a test with its own home never sees a
+    directory created for another.
+    """
+    monkeypatch.setattr(Path, "home", lambda: _shared_home)
+    return _shared_home
+
+
+@pytest.fixture
+def isolated_home(fake_home: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point Path.home at this test's own tmp_path for tests that write config."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    return tmp_path